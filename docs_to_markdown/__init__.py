@@ -1,3 +1,3 @@
-__all__ = ["convert_folder"]
+__all__ = ["SofficePool", "convert_file", "convert_folder"]
 
-from .converter import convert_folder
+from .converter import SofficePool, convert_file, convert_folder
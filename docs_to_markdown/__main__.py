@@ -65,22 +65,28 @@ def main(argv: list[str] | None = None) -> int:
 
     output_dir = args.output_dir or (args.input_dir / "markdown")
 
-    report = convert_folder(
-        input_dir=args.input_dir,
-        output_dir=output_dir,
-        recursive=args.recursive,
-        include_doc=args.include_doc,
-        overwrite=args.overwrite,
-    )
-
-    print(f"Converted: {report.converted}")
-    print(f"Skipped:   {report.skipped}")
-    print(f"Failed:    {report.failed}")
+    try:
+        report = convert_folder(
+            input_dir=args.input_dir,
+            output_dir=output_dir,
+            recursive=args.recursive,
+            include_doc=args.include_doc,
+            overwrite=args.overwrite,
+        )
+    except (ValueError, RuntimeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
 
+    # Build the whole summary and write it once, however many failures.
+    lines = [
+        f"Converted: {report.converted}",
+        f"Skipped:   {report.skipped}",
+        f"Failed:    {report.failed}",
+    ]
     if report.failures:
-        print("\nFailures:")
-        for item in report.failures:
-            print(f"- {item}")
+        lines.append("\nFailures:")
+        lines.extend(f"- {item}" for item in report.failures)
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return 0 if report.failed == 0 else 2
 
@@ -1,15 +1,44 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import queue
+import re
 import shutil
+import signal
+import socket
+import stat
 import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import BinaryIO
+from typing import TYPE_CHECKING
 
-import mammoth
-import mammoth.images
-from bs4 import BeautifulSoup
-from markdownify import MarkdownConverter
+if TYPE_CHECKING:
+    from typing import Callable, Iterator
+
+    from markdownify import MarkdownConverter
+
+_BLANK_LINES_RE = re.compile(rb"\n{3,}")
+
+# posix_fadvise is missing on Windows and macOS.
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# Minimum seconds between two progress callbacks.
+_PROGRESS_INTERVAL = 0.1
+
+# Markup in mammoth output that html.parser mishandles and lxml's parser
+# tolerates. Mammoth does not normally emit any of it.
+_NEEDS_LXML_RE = re.compile(r"<!\[CDATA\[|<script|<style|<!--", re.IGNORECASE)
+
+
+class ConversionCancelled(Exception):
+    """Raised when stop_event interrupts a running LibreOffice conversion."""
 
 
 @dataclass(frozen=True)
@@ -20,55 +49,108 @@ class ConversionReport:
     failures: tuple[str, ...]
 
 
-def _iter_input_files(input_dir: Path, *, recursive: bool, include_doc: bool) -> list[Path]:
-    if recursive:
-        candidates = list(input_dir.rglob("*"))
-    else:
-        candidates = list(input_dir.glob("*"))
+def _walk_input_files(input_dir: Path, *, recursive: bool, exts: set[str]) -> Iterator[str]:
+    # os.scandir reuses the directory entry type, so unrelated entries cost no
+    # stat() call. Plain path strings are yielded so the caller can sort them
+    # before building Path objects. Like Path.rglob, symlinked directories are
+    # not descended into and unreadable subfolders are skipped.
+    stack = [os.fspath(input_dir)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except PermissionError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                    continue
+                name = entry.name
+                dot = name.rfind(".")
+                if dot > 0 and name[dot:].lower() in exts and entry.is_file():
+                    yield entry.path
+
 
+def _iter_input_files(input_dir: Path, *, recursive: bool, include_doc: bool) -> list[Path]:
     exts = {".docx"}
     if include_doc:
         exts.add(".doc")
 
-    files: list[Path] = []
-    for p in candidates:
-        if not p.is_file():
-            continue
-        if p.suffix.lower() in exts:
-            files.append(p)
-
-    files.sort(key=lambda x: str(x).lower())
-    return files
+    paths = list(_walk_input_files(input_dir, recursive=recursive, exts=exts))
+    paths.sort(key=str.casefold)
+    return [Path(p) for p in paths]
 
 
 def _output_md_path(input_file: Path, *, input_dir: Path, output_dir: Path) -> Path:
-    rel = input_file.relative_to(input_dir)
+    # Discovered files are joined onto input_dir, so slicing off its string
+    # prefix is enough; relative_to re-parses both paths on every call.
+    src = str(input_file)
+    prefix = os.path.join(str(input_dir), "")
+    if src.startswith(prefix):
+        rel = src[len(prefix) :]
+    else:
+        rel = str(input_file.relative_to(input_dir))
     # Mirror subfolders; keep base filename; change extension to .md
-    return (output_dir / rel).with_suffix(".md")
+    return output_dir / (os.path.splitext(rel)[0] + ".md")
 
 
 def _ensure_parent_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def _write_bytes(path: Path, data: bytes) -> None:
+    # Write next to the target and rename it into place, so an interrupted
+    # run never leaves a truncated .md that later runs would skip. Raw os
+    # calls skip the buffering layers of Path.write_bytes; O_BINARY keeps
+    # Windows from translating newlines.
+    tmp = path.with_name(f".{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    view = memoryview(data)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    # 0o666 lets the umask decide, as for any newly created file.
+    fd = os.open(tmp, flags, 0o666)
+    try:
+        try:
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        try:
+            # A replaced output keeps its permissions.
+            os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def _assets_dir_for_md(md_path: Path) -> Path:
     return md_path.parent / f"{md_path.stem}_files"
 
 
+_EXTENSIONS_BY_CONTENT_TYPE = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/bmp": ".bmp",
+    "image/tiff": ".tiff",
+    "image/svg+xml": ".svg",
+}
+
+
 def _extension_from_content_type(content_type: str) -> str:
+    # Mammoth reports clean, lowercase types, so try them as is first.
+    ext = _EXTENSIONS_BY_CONTENT_TYPE.get(content_type)
+    if ext is not None:
+        return ext
+
     content_type = (content_type or "").lower().strip()
-    mapping = {
-        "image/png": ".png",
-        "image/jpeg": ".jpg",
-        "image/jpg": ".jpg",
-        "image/gif": ".gif",
-        "image/webp": ".webp",
-        "image/bmp": ".bmp",
-        "image/tiff": ".tiff",
-        "image/svg+xml": ".svg",
-    }
-    if content_type in mapping:
-        return mapping[content_type]
+    if content_type in _EXTENSIONS_BY_CONTENT_TYPE:
+        return _EXTENSIONS_BY_CONTENT_TYPE[content_type]
 
     if "/" in content_type:
         subtype = content_type.split("/", 1)[1]
@@ -81,52 +163,93 @@ def _extension_from_content_type(content_type: str) -> str:
     return ".bin"
 
 
-def _normalize_html(html: str) -> str:
-    # Mammoth emits HTML fragments. Wrap to make soup parsing consistent.
-    soup = BeautifulSoup(f"<div>{html}</div>", "lxml")
-    wrapper = soup.find("div")
-    return "".join(str(child) for child in (wrapper.contents if wrapper else soup.contents))
-
+@lru_cache(maxsize=1)
+def _get_converter() -> MarkdownConverter:
+    # convert_soup() only reads the converter's options, so one instance can
+    # serve every document. Built lazily so each worker process creates its
+    # own, and imported here so importing this module (e.g. from the GUI)
+    # does not load markdownify.
+    from markdownify import MarkdownConverter
 
-class _MdConverter(MarkdownConverter):
     # Keep markdownify defaults, but avoid overly aggressive escaping.
-    def __init__(self) -> None:
-        super().__init__(
-            heading_style="ATX",
-            bullets="-",
-            strong_em_symbol="*",
-            code_language="",
-        )
+    return MarkdownConverter(
+        heading_style="ATX",
+        bullets="-",
+        strong_em_symbol="*",
+        code_language="",
+    )
+
+
+def _html_to_markdown(html: str) -> str:
+    from bs4 import BeautifulSoup
 
+    # Parse exactly once. html.parser builds a flatter tree that markdownify
+    # walks faster than lxml's, so lxml is only used for the odd fragment it
+    # has to clean up.
+    features = "lxml" if _NEEDS_LXML_RE.search(html) else "html.parser"
+    return _get_converter().convert_soup(BeautifulSoup(html, features))
+
+
+def _docx_to_markdown(docx_path: Path, *, output_md_path: Path) -> bytes:
+    # Imported on first use so the GUI starts without loading mammoth.
+    import mammoth
+    import mammoth.images
 
-def _docx_to_markdown(docx_path: Path, *, output_md_path: Path) -> str:
     images_written = 0
     image_index = 0
     assets_dir = _assets_dir_for_md(output_md_path)
+    assets_dir_created = False
+
+    # Content digest -> Markdown src of the file already written for it, so a
+    # logo repeated across pages is stored and linked once.
+    seen: dict[bytes, str] = {}
 
     def _convert_image(image: object) -> dict[str, str]:
-        nonlocal image_index, images_written
-        image_index += 1
+        nonlocal image_index, images_written, assets_dir_created
+
+        if not assets_dir_created:
+            assets_dir.mkdir(parents=True, exist_ok=True)
+            assets_dir_created = True
+
+        # Stream the image to a scratch file while hashing it; it only gets a
+        # real name if its content has not been seen in this document yet.
+        part_path = assets_dir / ".image.part"
+        digest = hashlib.blake2b(digest_size=16)
+        opener = getattr(image, "open")
+        try:
+            with opener() as image_bytes, part_path.open("wb") as dst:  # type: ignore[call-arg]
+                if isinstance(image_bytes, (bytes, bytearray)):
+                    digest.update(image_bytes)
+                    dst.write(image_bytes)
+                else:
+                    while chunk := image_bytes.read(1 << 20):  # type: ignore[union-attr]
+                        digest.update(chunk)
+                        dst.write(chunk)
+                if _HAS_FADVISE:
+                    # Nothing re-reads the image; tell the kernel its pages
+                    # can go before the documents still being parsed.
+                    dst.flush()
+                    os.posix_fadvise(dst.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+        key = digest.digest()
+        if key in seen:
+            part_path.unlink()
+            return {"src": seen[key]}
 
+        image_index += 1
         content_type = getattr(image, "content_type", "")
         ext = _extension_from_content_type(str(content_type))
         filename = f"image{image_index}{ext}"
-        file_path = assets_dir / filename
-
-        assets_dir.mkdir(parents=True, exist_ok=True)
-
-        opener = getattr(image, "open")
-        with opener() as image_bytes:  # type: ignore[call-arg]
-            if isinstance(image_bytes, (bytes, bytearray)):
-                data = bytes(image_bytes)
-            else:
-                data = image_bytes.read()  # type: ignore[union-attr]
-        file_path.write_bytes(data)
+        part_path.replace(assets_dir / filename)
         images_written += 1
 
         # Use POSIX separators for Markdown links.
         rel = Path(assets_dir.name) / filename
-        return {"src": rel.as_posix()}
+        seen[key] = rel.as_posix()
+        return {"src": seen[key]}
 
     with docx_path.open("rb") as f:
         result = mammoth.convert_to_html(
@@ -134,40 +257,54 @@ def _docx_to_markdown(docx_path: Path, *, output_md_path: Path) -> str:
             convert_image=mammoth.images.img_element(_convert_image),
         )
 
-    html = _normalize_html(result.value)
-    md = _MdConverter().convert(html)
+    # Tidy up as UTF-8 bytes, which is what gets written anyway.
+    data = _html_to_markdown(result.value).encode("utf-8")
 
     # mammoth/markdownify can produce excessive blank lines; keep it tidy.
-    md = md.replace("\r\n", "\n")
-    while "\n\n\n" in md:
-        md = md.replace("\n\n\n", "\n\n")
+    data = _BLANK_LINES_RE.sub(b"\n\n", data.replace(b"\r\n", b"\n"))
 
     # If no images were written, avoid leaving an empty assets directory.
-    if images_written == 0:
+    if assets_dir_created and images_written == 0:
         try:
-            if assets_dir.exists():
-                assets_dir.rmdir()
+            assets_dir.rmdir()
         except Exception:
             pass
 
-    return md.strip() + "\n"
+    return data.strip() + b"\n"
 
 
+@lru_cache(maxsize=1)
 def _find_soffice() -> str | None:
+    # Scanning PATH is not free; the result is looked up once per process.
     return shutil.which("soffice") or shutil.which("soffice.exe")
 
 
-def _doc_to_docx_via_libreoffice(doc_path: Path, *, work_dir: Path) -> Path:
-    soffice = _find_soffice()
-    if not soffice:
-        raise RuntimeError("LibreOffice 'soffice' not found on PATH; cannot convert .doc")
+# Seconds to wait for a LibreOffice listener to accept connections.
+_SOFFICE_STARTUP_TIMEOUT = 30
+
+# Number of .doc files handed to a single soffice invocation.
+_SOFFICE_BATCH_SIZE = 32
 
-    # LibreOffice writes output into --outdir with same base filename.
-    outdir = work_dir
-    outdir.mkdir(parents=True, exist_ok=True)
+# A batch that runs longer than this many seconds per file is abandoned and
+# its files are retried one at a time.
+_SOFFICE_TIMEOUT_PER_FILE = 60
 
-    cmd = [
+# soffice instances run side by side, each with its own user profile.
+_SOFFICE_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _soffice_convert_cmd(
+    soffice: str,
+    *,
+    outdir: Path,
+    doc_paths: list[Path],
+    profile_dir: Path,
+) -> list[str]:
+    return [
         soffice,
+        # soffice hands the job to whichever LibreOffice already runs on this
+        # profile, if any. Separate profiles let several instances run at once.
+        f"-env:UserInstallation={profile_dir.as_uri()}",
         "--headless",
         "--nologo",
         "--nolockcheck",
@@ -177,13 +314,367 @@ def _doc_to_docx_via_libreoffice(doc_path: Path, *, work_dir: Path) -> Path:
         "docx",
         "--outdir",
         str(outdir),
-        str(doc_path),
+        *map(str, doc_paths),
     ]
 
-    proc = subprocess.run(cmd, capture_output=True, text=True)
-    if proc.returncode != 0:
-        stderr = (proc.stderr or proc.stdout or "").strip()
-        raise RuntimeError(f"LibreOffice conversion failed: {stderr}")
+
+# soffice gets a process group of its own so cancelling can end it together
+# with any helper processes it started.
+if os.name == "posix":
+    _NEW_PROCESS_GROUP: dict[str, object] = {"start_new_session": True}
+else:
+    _NEW_PROCESS_GROUP = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+
+# Seconds between stop_event checks while soffice runs.
+_SOFFICE_POLL_INTERVAL = 0.1
+
+# Seconds to wait for soffice to exit at each step of killing it.
+_KILL_TIMEOUT = 10
+
+
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    """End proc together with every process it started."""
+    if os.name != "posix":
+        # soffice.exe only launches soffice.bin, which terminate() would leave
+        # running; /T ends the whole tree.
+        try:
+            subprocess.run(
+                ["taskkill", "/T", "/F", "/PID", str(proc.pid)],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=_KILL_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+    else:
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    try:
+        proc.communicate(timeout=_KILL_TIMEOUT)
+        return
+    except subprocess.TimeoutExpired:
+        pass
+    if os.name == "posix":
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    proc.kill()
+    # wait() rather than communicate(): a surviving grandchild may hold the
+    # output pipes open, and cancelling must not hang on it.
+    try:
+        proc.wait(timeout=_KILL_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        pass
+
+
+def _run_soffice(
+    cmd: list[str],
+    *,
+    timeout: float | None = None,
+    stop_event: threading.Event | None = None,
+) -> tuple[int, str]:
+    """
+    Run a soffice command and return (returncode, stderr or stdout).
+
+    Raises ConversionCancelled as soon as stop_event is set, and
+    subprocess.TimeoutExpired after timeout seconds; either way soffice is
+    killed first.
+    """
+    if stop_event is not None and stop_event.is_set():
+        raise ConversionCancelled
+    deadline = None if timeout is None else time.monotonic() + timeout
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        **_NEW_PROCESS_GROUP,
+    )
+    while True:
+        try:
+            # communicate() may be retried after a timeout without losing output.
+            stdout, stderr = proc.communicate(timeout=_SOFFICE_POLL_INTERVAL)
+        except subprocess.TimeoutExpired:
+            pass
+        else:
+            return proc.returncode, (stderr or stdout or "").strip()
+        cancelled = stop_event is not None and stop_event.is_set()
+        if cancelled or (deadline is not None and time.monotonic() >= deadline):
+            _kill_process_group(proc)
+            if cancelled:
+                raise ConversionCancelled
+            # Only the executable: the full command line makes for an
+            # unreadable failure message.
+            raise subprocess.TimeoutExpired(cmd[0], timeout)
+
+
+# Times a listener is started, each on a new port, before giving up.
+_LISTENER_START_ATTEMPTS = 3
+
+# Ports handed to listeners in this process. A port is only known to be free
+# until its probe socket closes, so two listeners starting at once could
+# otherwise be given the same one.
+_listener_ports: set[int] = set()
+_listener_ports_lock = threading.Lock()
+
+
+def _claim_listener_port() -> int:
+    with _listener_ports_lock:
+        while True:
+            with socket.socket() as sock:
+                sock.bind(("127.0.0.1", 0))
+                port = sock.getsockname()[1]
+            if port not in _listener_ports:
+                _listener_ports.add(port)
+                return port
+
+
+def _release_listener_port(port: int) -> None:
+    with _listener_ports_lock:
+        _listener_ports.discard(port)
+
+
+class _LibreOfficeListener:
+    """
+    A long-running headless soffice that conversions are handed to.
+
+    soffice forwards a --convert-to request to the instance already running on
+    the same user profile and waits for it, so running conversions with
+    profile_dir skips the multi-second LibreOffice startup every time.
+    """
+
+    def __init__(self, soffice: str) -> None:
+        self.soffice = soffice
+        self.profile_dir = Path(tempfile.mkdtemp(prefix="docs_to_markdown_lo_"))
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._port = 0
+        self._ready = False
+        self._closed = False
+        # Held while soffice is launched or ended, so close() on another
+        # thread cannot slip in between and leave a process behind.
+        self._lock = threading.RLock()
+
+    def start(self) -> None:
+        """Launch soffice unless it runs; raises ConversionCancelled once closed."""
+        with self._lock:
+            if self._closed:
+                raise ConversionCancelled
+            if self._proc is not None and self._proc.poll() is None:
+                return
+            _release_listener_port(self._port)
+            self._port = port = _claim_listener_port()
+            self._ready = False
+            self._proc = subprocess.Popen(
+                [
+                    self.soffice,
+                    f"-env:UserInstallation={self.profile_dir.as_uri()}",
+                    "--headless",
+                    "--invisible",
+                    "--nologo",
+                    "--nolockcheck",
+                    "--nodefault",
+                    "--norestore",
+                    f"--accept=socket,host=127.0.0.1,port={port};urp;",
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **_NEW_PROCESS_GROUP,
+            )
+
+    def wait_ready(self, timeout: float = _SOFFICE_STARTUP_TIMEOUT) -> bool:
+        """
+        Wait until the listener accepts connections.
+
+        A conversion sent before then starts a second soffice on the same
+        profile, which fails on the profile lock. Returns False if soffice
+        exited or did not come up in time.
+        """
+        if self._ready and self._proc is not None and self._proc.poll() is None:
+            return True
+        self._ready = False
+        deadline = time.monotonic() + timeout
+        while self._proc is not None and self._proc.poll() is None:
+            try:
+                socket.create_connection(("127.0.0.1", self._port), timeout=0.5).close()
+            except OSError:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.1)
+            else:
+                self._ready = True
+                return True
+        return False
+
+    def ensure_ready(self) -> None:
+        """
+        Start soffice if it is not running and wait until it accepts conversions.
+
+        An instance that has exited, or hangs during startup, is started over
+        on a new port, in case another process took the old one before soffice
+        could listen on it. Raises RuntimeError if that fails too.
+        """
+        if self._proc is None:
+            self.start()
+        for _ in range(_LISTENER_START_ATTEMPTS - 1):
+            if self.wait_ready():
+                return
+            self.stop()
+            self.start()
+        if self.wait_ready():
+            return
+        self.stop()
+        raise RuntimeError("LibreOffice listener did not start accepting conversions")
+
+    def stop(self) -> None:
+        """End soffice but keep its profile, so start() can bring it back."""
+        with self._lock:
+            proc, self._proc = self._proc, None
+            self._ready = False
+            _release_listener_port(self._port)
+            self._port = 0
+            if proc is not None and proc.poll() is None:
+                # The soffice wrapper is not the process holding the profile.
+                _kill_process_group(proc)
+
+    def close(self) -> None:
+        """End soffice and delete its profile; it cannot be started again."""
+        with self._lock:
+            self._closed = True
+            self.stop()
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+    def __enter__(self) -> _LibreOfficeListener:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class SofficePool:
+    """
+    Running LibreOffice instances that .doc files are handed to.
+
+    Pass one as soffice_pool to convert_folder or convert_file to skip the
+    LibreOffice startup on every call, and close it (or use it as a context
+    manager) when done. Each instance has a profile and port of its own: one
+    soffice cannot run conversions concurrently, but separate instances can,
+    so .doc throughput scales with the pool size.
+    """
+
+    def __init__(self, soffice: str, size: int = _SOFFICE_MAX_WORKERS) -> None:
+        self.listeners = [_LibreOfficeListener(soffice) for _ in range(size)]
+        self._idle: queue.SimpleQueue[_LibreOfficeListener] = queue.SimpleQueue()
+        for listener in self.listeners:
+            self._idle.put(listener)
+        self._closed = False
+        # Taken by start() while it launches instances and by close(), so an
+        # instance is never launched after the pool has been closed.
+        self._lock = threading.Lock()
+
+    @property
+    def profile_dirs(self) -> list[Path]:
+        return [listener.profile_dir for listener in self.listeners]
+
+    def start(self) -> None:
+        """
+        Start every instance; raises RuntimeError if one cannot be started.
+
+        Raises ConversionCancelled if the pool is or gets closed meanwhile.
+        """
+        # Launch every instance before waiting so they start up in parallel.
+        with self._lock:
+            for listener in self.listeners:
+                if self._closed:
+                    raise ConversionCancelled
+                listener.start()
+        for listener in self.listeners:
+            listener.ensure_ready()
+        if self._closed:
+            # close() ran while the instances were coming up.
+            for listener in self.listeners:
+                listener.stop()
+            raise ConversionCancelled
+
+    @contextmanager
+    def lease(self, *, stop_event: threading.Event | None = None) -> Iterator[Path]:
+        """
+        Borrow an idle listener for one conversion; yields its profile.
+
+        A listener that has exited since is started again first. If the
+        conversion times out or is cancelled, the listener may still be busy
+        with it, so it is stopped; the next lease that converts starts it
+        again. Once the pool is closed or stop_event is set, raises
+        ConversionCancelled without starting anything.
+        """
+        listener = self._idle.get()
+        if self._closed or (stop_event is not None and stop_event.is_set()):
+            self._idle.put(listener)
+            raise ConversionCancelled
+        try:
+            listener.ensure_ready()
+            if self._closed:
+                # close() ran while the listener was starting up; stopped below.
+                raise ConversionCancelled
+            yield listener.profile_dir
+        except (subprocess.TimeoutExpired, ConversionCancelled):
+            listener.stop()
+            raise
+        finally:
+            self._idle.put(listener)
+
+    def close(self) -> None:
+        """End every instance; the pool cannot be started or leased from again."""
+        with self._lock:
+            self._closed = True
+        for listener in self.listeners:
+            listener.close()
+
+    def __enter__(self) -> SofficePool:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _doc_to_docx_via_libreoffice(
+    doc_path: Path,
+    *,
+    work_dir: Path,
+    profile_dir: Path | None = None,
+    stop_event: threading.Event | None = None,
+) -> Path:
+    soffice = _find_soffice()
+    if not soffice:
+        raise RuntimeError("LibreOffice 'soffice' not found on PATH; cannot convert .doc")
+
+    # LibreOffice writes output into --outdir with same base filename. Each
+    # call gets a fresh output folder, so neither a concurrent caller nor a
+    # .docx left behind by an earlier failed run can pass for this output.
+    # Default profiles are per process.
+    pid = os.getpid()
+    work_dir.mkdir(parents=True, exist_ok=True)
+    outdir = Path(tempfile.mkdtemp(prefix="out_", dir=work_dir))
+
+    cmd = _soffice_convert_cmd(
+        soffice,
+        outdir=outdir,
+        doc_paths=[doc_path],
+        profile_dir=profile_dir or work_dir / f"profile_{pid}",
+    )
+
+    returncode, output = _run_soffice(
+        cmd, timeout=_SOFFICE_TIMEOUT_PER_FILE, stop_event=stop_event
+    )
+    if returncode != 0:
+        raise RuntimeError(f"LibreOffice conversion failed: {output}")
 
     produced = outdir / (doc_path.stem + ".docx")
     if not produced.exists():
@@ -192,6 +683,173 @@ def _doc_to_docx_via_libreoffice(doc_path: Path, *, work_dir: Path) -> Path:
     return produced
 
 
+def _iter_doc_batches(doc_paths: list[Path], *, batch_size: int) -> Iterator[list[Path]]:
+    # soffice names each output after its input stem, so one batch must not
+    # contain two files with the same stem (e.g. from different subfolders).
+    batch: list[Path] = []
+    stems: set[str] = set()
+    for path in doc_paths:
+        stem = path.stem.casefold()
+        if len(batch) >= batch_size or stem in stems:
+            yield batch
+            batch = []
+            stems = set()
+        batch.append(path)
+        stems.add(stem)
+    if batch:
+        yield batch
+
+
+def _submit_doc_batches(
+    executor: Executor,
+    doc_paths: list[Path],
+    *,
+    soffice: str,
+    work_dir: Path,
+    soffice_pool: SofficePool | None = None,
+    stop_event: threading.Event | None = None,
+) -> dict[Future, list[Path]]:
+    """
+    Start converting .doc files with one soffice invocation per batch.
+
+    With soffice_pool each batch is handed to one of its instances. Otherwise
+    batches run on up to _SOFFICE_MAX_WORKERS soffice instances at once, each
+    with a user profile of its own that is reused across its batches, since
+    initializing a fresh profile is slow. Batches not yet started when
+    stop_event is set are skipped.
+
+    Each returned future gives a mapping of input .doc path to produced .docx
+    path for its batch. Files missing from the mapping were not converted and
+    should be retried one at a time so they get their own error message.
+    """
+    batches = list(_iter_doc_batches(doc_paths, batch_size=_SOFFICE_BATCH_SIZE))
+    if soffice_pool is not None:
+        lease = partial(soffice_pool.lease, stop_event=stop_event)
+    else:
+        profiles: queue.SimpleQueue[Path] = queue.SimpleQueue()
+        for n in range(min(_SOFFICE_MAX_WORKERS, len(batches))):
+            profiles.put(work_dir / f"profile{n}")
+
+        @contextmanager
+        def lease() -> Iterator[Path]:
+            profile_dir = profiles.get()
+            try:
+                yield profile_dir
+            finally:
+                profiles.put(profile_dir)
+
+    def _run_batch(n: int, batch: list[Path]) -> dict[Path, Path]:
+        if stop_event is not None and stop_event.is_set():
+            return {}
+        outdir = work_dir / f"batch{n}"
+        # Never pick up output left behind by an interrupted earlier run.
+        shutil.rmtree(outdir, ignore_errors=True)
+        outdir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with lease() as profile_dir:
+                # soffice exits 0 even when individual files fail; check each output.
+                _run_soffice(
+                    _soffice_convert_cmd(
+                        soffice, outdir=outdir, doc_paths=batch, profile_dir=profile_dir
+                    ),
+                    timeout=_SOFFICE_TIMEOUT_PER_FILE * len(batch),
+                    stop_event=stop_event,
+                )
+        except (subprocess.TimeoutExpired, ConversionCancelled):
+            # A hung document must not stall the rest; whatever was written
+            # before the timeout or cancel is kept below.
+            pass
+
+        produced: dict[Path, Path] = {}
+        for src in batch:
+            out = outdir / (src.stem + ".docx")
+            if out.exists():
+                produced[src] = out
+        return produced
+
+    return {executor.submit(_run_batch, n, batch): batch for n, batch in enumerate(batches)}
+
+
+def _init_worker() -> None:
+    # Load mammoth and warm up both parsers and markdownify once per worker
+    # process rather than on the first document each worker picks up.
+    import mammoth.images  # noqa: F401
+
+    _html_to_markdown("<p></p>")
+    _html_to_markdown("<p><!-- --></p>")
+
+
+def _convert_one(
+    src: Path,
+    *,
+    input_dir: Path,
+    output_dir: Path,
+    temp_dir: Path,
+    docx_path: Path | None = None,
+    stop_event: threading.Event | None = None,
+) -> tuple[str, str]:
+    # Files whose output already exists were skipped by the caller.
+    dest = _output_md_path(src, input_dir=input_dir, output_dir=output_dir)
+
+    try:
+        _ensure_parent_dir(dest)
+
+        if src.suffix.lower() == ".docx":
+            data = _docx_to_markdown(src, output_md_path=dest)
+        else:
+            # .doc path; docx_path is set when a batch conversion or a
+            # LibreOffice listener already produced the .docx.
+            if docx_path is None:
+                docx_path = _doc_to_docx_via_libreoffice(
+                    src, work_dir=temp_dir, stop_event=stop_event
+                )
+            data = _docx_to_markdown(docx_path, output_md_path=dest)
+
+        _write_bytes(dest, data)
+        return "ok", ""
+    except ConversionCancelled:
+        return "cancelled", ""
+    except Exception as e:
+        return "fail", f"{src}: {e}"
+
+
+def _case_insensitive(path: Path) -> bool:
+    """Whether file names under path (or its nearest existing parent) ignore case."""
+    # os.path.normcase only folds case on Windows, yet macOS volumes are
+    # usually case-insensitive too. Look the folder up with its case swapped.
+    while not path.exists() and path.parent != path:
+        path = path.parent
+    name = str(path)
+    swapped = name.swapcase()
+    if swapped == name:
+        return os.path.normcase("A") == "a"
+    try:
+        return os.path.samefile(name, swapped)
+    except OSError:
+        return False
+
+
+def _job_result(future: Future, src: Path) -> tuple[str, str]:
+    try:
+        return future.result()
+    except Exception as e:
+        # A worker process died (e.g. BrokenProcessPool).
+        return "fail", f"{src}: {e}"
+
+
+def _docx_executor(n_jobs: int, max_workers: int | None) -> Executor:
+    workers = min(max_workers or os.cpu_count() or 1, n_jobs)
+    if workers < 2:
+        # Spawning processes for a single worker only adds startup cost.
+        return ThreadPoolExecutor(max_workers=1)
+    # Imported here: it pulls in multiprocessing, which the GUI and
+    # single-worker runs never need.
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+
 def convert_folder(
     *,
     input_dir: Path,
@@ -199,6 +857,10 @@ def convert_folder(
     recursive: bool = False,
     include_doc: bool = False,
     overwrite: bool = False,
+    max_workers: int | None = None,
+    progress_callback: Callable[[int, int, Path], None] | None = None,
+    stop_event: threading.Event | None = None,
+    soffice_pool: SofficePool | None = None,
 ) -> ConversionReport:
     input_dir = input_dir.resolve()
     output_dir = output_dir.resolve()
@@ -207,36 +869,233 @@ def convert_folder(
         raise ValueError(f"input_dir does not exist or is not a directory: {input_dir}")
 
     files = _iter_input_files(input_dir, recursive=recursive, include_doc=include_doc)
+    return _convert_files(
+        files,
+        input_dir=input_dir,
+        output_dir=output_dir,
+        recursive=recursive,
+        overwrite=overwrite,
+        max_workers=max_workers,
+        progress_callback=progress_callback,
+        stop_event=stop_event,
+        soffice_pool=soffice_pool,
+    )
 
-    converted = 0
-    skipped = 0
-    failed = 0
-    failures: list[str] = []
 
+def convert_file(
+    *,
+    input_file: Path,
+    output_dir: Path,
+    overwrite: bool = False,
+    progress_callback: Callable[[int, int, Path], None] | None = None,
+    stop_event: threading.Event | None = None,
+    soffice_pool: SofficePool | None = None,
+) -> ConversionReport:
+    input_file = input_file.resolve()
+    output_dir = output_dir.resolve()
+
+    if not input_file.is_file():
+        raise ValueError(f"input_file does not exist or is not a file: {input_file}")
+    if input_file.suffix.lower() not in {".doc", ".docx"}:
+        raise ValueError(f"input_file is not a Word document (.doc/.docx): {input_file}")
+
+    # Converted in place: <output_dir>/<name>.md, with no copy of the input.
+    return _convert_files(
+        [input_file],
+        input_dir=input_file.parent,
+        output_dir=output_dir,
+        recursive=False,
+        overwrite=overwrite,
+        max_workers=1,
+        progress_callback=progress_callback,
+        stop_event=stop_event,
+        soffice_pool=soffice_pool,
+    )
+
+
+def _convert_files(
+    files: list[Path],
+    *,
+    input_dir: Path,
+    output_dir: Path,
+    recursive: bool,
+    overwrite: bool,
+    max_workers: int | None,
+    progress_callback: Callable[[int, int, Path], None] | None,
+    stop_event: threading.Event | None,
+    soffice_pool: SofficePool | None,
+) -> ConversionReport:
     temp_dir = output_dir / ".__tmp_doc_conversion__"
 
-    for src in files:
-        dest = _output_md_path(src, input_dir=input_dir, output_dir=output_dir)
+    job = partial(
+        _convert_one,
+        input_dir=input_dir,
+        output_dir=output_dir,
+        temp_dir=temp_dir,
+    )
 
-        if dest.exists() and not overwrite:
-            skipped += 1
-            continue
+    results: dict[Path, tuple[str, str]] = {}
 
+    if _case_insensitive(output_dir):
+        path_key: Callable[[str], str] = lambda p: os.path.normcase(p).casefold()
+    else:
+        path_key = os.path.normcase
+
+    # One walk of the output folder instead of an exists() check per file.
+    existing: set[str] = set()
+    if not overwrite and output_dir.is_dir():
+        existing = {
+            path_key(p)
+            for p in _walk_input_files(output_dir, recursive=recursive, exts={".md"})
+        }
+
+    # Files run in parallel, so two inputs with the same output (a.doc and
+    # a.docx) would race for it. One input claims it and the rest are
+    # skipped, leaving the file a one-at-a-time run would have: the first in
+    # discovery order keeps it, or with overwrite the last one replaces it.
+    pending: list[Path] = []
+    for src in reversed(files) if overwrite else files:
+        dest = path_key(str(_output_md_path(src, input_dir=input_dir, output_dir=output_dir)))
+        if dest in existing:
+            results[src] = ("skip", "")
+        else:
+            existing.add(dest)
+            pending.append(src)
+    if overwrite:
+        pending.reverse()
+
+    docx_files = [p for p in pending if p.suffix.lower() == ".docx"]
+    doc_files = [p for p in pending if p.suffix.lower() != ".docx"]
+
+    soffice = _find_soffice() if doc_files else None
+    if doc_files and not soffice:
+        raise RuntimeError("LibreOffice 'soffice' not found on PATH; cannot convert .doc")
+
+    # With a pool, every .doc conversion is handed to one of its running
+    # instances, several at a time.
+    doc_workers = 1
+    batch_workers = _SOFFICE_MAX_WORKERS
+    if soffice_pool is not None and doc_files:
         try:
-            _ensure_parent_dir(dest)
+            soffice_pool.start()
+        except ConversionCancelled:
+            # The pool was closed, e.g. because the GUI is shutting down.
+            for src in doc_files:
+                results[src] = ("cancelled", "")
+            doc_files = []
+        except RuntimeError as e:
+            # Only the .doc files need LibreOffice; .docx files still convert.
+            for src in doc_files:
+                results[src] = ("fail", f"{src}: {e}")
+            doc_files = []
+        else:
+            doc_workers = batch_workers = len(soffice_pool.listeners)
 
-            if src.suffix.lower() == ".docx":
-                md = _docx_to_markdown(src, output_md_path=dest)
-            else:
-                # .doc path
-                docx_path = _doc_to_docx_via_libreoffice(src, work_dir=temp_dir)
-                md = _docx_to_markdown(docx_path, output_md_path=dest)
+    # .doc jobs run on threads, so they can watch stop_event while soffice runs.
+    def _doc_job(src: Path) -> tuple[str, str]:
+        if soffice_pool is None:
+            return job(src, stop_event=stop_event)
+        # Converted within the lease, so that a listener which timed out is
+        # restarted before it is handed out again.
+        try:
+            with soffice_pool.lease(stop_event=stop_event) as profile_dir:
+                docx_path = _doc_to_docx_via_libreoffice(
+                    src, work_dir=temp_dir, profile_dir=profile_dir, stop_event=stop_event
+                )
+        except ConversionCancelled:
+            return "cancelled", ""
+        except Exception as e:
+            return "fail", f"{src}: {e}"
+        return job(src, docx_path=docx_path)
+
+    total = len(files)
+    last_progress = float("-inf")
+
+    # .docx conversion is CPU-bound and runs across processes. .doc files are
+    # converted to .docx in as few soffice runs as possible meanwhile, and each
+    # batch's results join the .docx pool as soon as the batch is done. Files a
+    # batch missed are retried one at a time per soffice instance.
+    with _docx_executor(len(pending), max_workers) as docx_pool, ThreadPoolExecutor(
+        max_workers=doc_workers
+    ) as doc_pool, ThreadPoolExecutor(max_workers=batch_workers) as batch_pool:
+        futures = {docx_pool.submit(job, src): src for src in docx_files}
+        batches = (
+            _submit_doc_batches(
+                batch_pool,
+                doc_files,
+                soffice=soffice,
+                work_dir=temp_dir,
+                soffice_pool=soffice_pool,
+                stop_event=stop_event,
+            )
+            if soffice and doc_files
+            else {}
+        )
+
+        not_done = set(futures) | set(batches)
+        stopping = False
+        while not_done and not stopping:
+            finished, not_done = wait(not_done, return_when=FIRST_COMPLETED)
+            for future in finished:
+                if future in batches:
+                    produced = future.result() if future.exception() is None else {}
+                    cancelled = stop_event is not None and stop_event.is_set()
+                    for src in batches[future]:
+                        if src in produced:
+                            job_future = docx_pool.submit(job, src, docx_path=produced[src])
+                        elif cancelled:
+                            # A retry would only start soffice again to be
+                            # cancelled straight away.
+                            results[src] = ("cancelled", "")
+                            continue
+                        else:
+                            job_future = doc_pool.submit(_doc_job, src)
+                        futures[job_future] = src
+                        not_done.add(job_future)
+                    continue
 
-            dest.write_text(md, encoding="utf-8")
+                src = futures[future]
+                done = len(results)
+                results[src] = _job_result(future, src)
+                if progress_callback:
+                    now = time.monotonic()
+                    # Progress drives UI redraws; ~10 per second is plenty.
+                    if now - last_progress >= _PROGRESS_INTERVAL or done == total - 1:
+                        last_progress = now
+                        progress_callback(done, total, src)
+                if stop_event is not None and stop_event.is_set():
+                    # Drop everything not yet started; files already being
+                    # converted are allowed to finish and are still reported.
+                    for pool in (docx_pool, doc_pool, batch_pool):
+                        pool.shutdown(wait=False, cancel_futures=True)
+                    stopping = True
+                    break
+
+    for future, src in futures.items():
+        if src not in results and future.done() and not future.cancelled():
+            results[src] = _job_result(future, src)
+
+    if progress_callback:
+        progress_callback(total, total, Path(""))
+
+    converted = 0
+    skipped = 0
+    failed = 0
+    failures: list[str] = []
+
+    # Tally in discovery order so the report does not depend on scheduling.
+    # Files cancelled by stop_event, before or during conversion, are left out.
+    for src in files:
+        if src not in results:
+            continue
+        status, msg = results[src]
+        if status == "ok":
             converted += 1
-        except Exception as e:
+        elif status == "skip":
+            skipped += 1
+        elif status == "fail":
             failed += 1
-            failures.append(f"{src}: {e}")
+            failures.append(msg)
 
     # Best-effort cleanup
     try:
@@ -1,34 +1,37 @@
 from __future__ import annotations
 
-import shutil
-import subprocess
+import bisect
+import hashlib
+import io
+import os
+import re
+import stat
 import sys
 import threading
-from dataclasses import dataclass
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import BinaryIO, Callable
+from typing import TYPE_CHECKING, Callable, Iterator
 
 import customtkinter as ctk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, ttk
 import tkinterdnd2 as tkdnd
 
-import mammoth
-import mammoth.images
-from bs4 import BeautifulSoup
-from markdownify import MarkdownConverter
-import markdown
-
 from docs_to_markdown.converter import (
-    _doc_to_docx_via_libreoffice,
-    _docx_to_markdown,
-    _ensure_parent_dir,
-    _extension_from_content_type,
-    _iter_input_files,
-    _normalize_html,
-    _output_md_path,
     ConversionReport,
+    SofficePool,
+    _find_soffice,
+    _walk_input_files,
+    convert_file,
+    convert_folder,
 )
 
+if TYPE_CHECKING:
+    from markdown_it import MarkdownIt
+    from markdown_it.token import Token
+
 
 def convert_folder_with_progress(
     *,
@@ -39,6 +42,7 @@ def convert_folder_with_progress(
     overwrite: bool = False,
     progress_callback: Callable[[int, int, Path], None] | None = None,
     stop_event: threading.Event | None = None,
+    soffice_pool: SofficePool | None = None,
 ) -> ConversionReport:
     """
     Convert files with progress tracking.
@@ -51,74 +55,255 @@ def convert_folder_with_progress(
         overwrite: Whether to overwrite existing .md files.
         progress_callback: Optional callback(current, total, current_file) for progress updates.
         stop_event: Optional threading.Event to signal cancellation.
+        soffice_pool: Optional running LibreOffice instances to hand .doc files to.
 
     Returns:
         ConversionReport with conversion statistics.
     """
-    input_dir = input_dir.resolve()
-    output_dir = output_dir.resolve()
+    return convert_folder(
+        input_dir=input_dir,
+        output_dir=output_dir,
+        recursive=recursive,
+        include_doc=include_doc,
+        overwrite=overwrite,
+        progress_callback=progress_callback,
+        stop_event=stop_event,
+        soffice_pool=soffice_pool,
+    )
 
-    if not input_dir.exists() or not input_dir.is_dir():
-        raise ValueError(f"input_dir does not exist or is not a directory: {input_dir}")
 
-    files = _iter_input_files(input_dir, recursive=recursive, include_doc=include_doc)
-    total_files = len(files)
+# Extensions accepted for single-file input.
+_WORD_EXTS: frozenset[str] = frozenset({".doc", ".docx"})
 
-    converted = 0
-    skipped = 0
-    failed = 0
-    failures: list[str] = []
 
-    temp_dir = output_dir / ".__tmp_doc_conversion__"
+def _needs_soffice(input_path: Path, is_file: bool, include_doc: bool) -> bool:
+    """Whether converting input_path will hand any file to LibreOffice."""
+    # A single .doc file is converted whatever the checkbox says.
+    if is_file:
+        return input_path.suffix.lower() == ".doc"
+    return include_doc
 
-    for idx, src in enumerate(files):
-        # Check for cancellation
-        if stop_event and stop_event.is_set():
-            break
 
-        # Update progress
-        if progress_callback:
-            progress_callback(idx, total_files, src)
+def _is_same_or_inside(path: Path, folder: Path) -> bool:
+    """Whether path is folder or lies inside it, comparing the paths as given."""
+    inner = os.path.normcase(os.fspath(path))
+    outer = os.path.normcase(os.fspath(folder))
+    return inner == outer or inner.startswith(os.path.join(outer, ""))
 
-        dest = _output_md_path(src, input_dir=input_dir, output_dir=output_dir)
 
-        if dest.exists() and not overwrite:
-            skipped += 1
-            continue
+_OUTPUT_INSIDE_INPUT_ERROR = (
+    "Output folder cannot be inside the input folder.\n\n"
+    "Please choose a different output location."
+)
 
-        try:
-            _ensure_parent_dir(dest)
 
-            if src.suffix.lower() == ".docx":
-                md = _docx_to_markdown(src, output_md_path=dest)
-            else:
-                # .doc path
-                docx_path = _doc_to_docx_via_libreoffice(src, work_dir=temp_dir)
-                md = _docx_to_markdown(docx_path, output_md_path=dest)
+def _scan_for_word_docs(folder: Path) -> tuple[bool, bool]:
+    """
+    Check a folder (not its subfolders) for Word documents in one pass.
 
-            dest.write_text(md, encoding="utf-8")
-            converted += 1
-        except Exception as e:
-            failed += 1
-            failures.append(f"{src}: {e}")
+    Returns:
+        (has_docx, has_doc), matching extensions case-insensitively.
+    """
+    has_docx = False
+    has_doc = False
+    with os.scandir(folder) as it:
+        for entry in it:
+            name = entry.name.lower()
+            if name.endswith(".docx"):
+                has_docx = has_docx or entry.is_file()
+            elif name.endswith(".doc"):
+                has_doc = has_doc or entry.is_file()
+            if has_docx and has_doc:
+                break
+    return has_docx, has_doc
+
+
+# Milliseconds the file selection must stay put before it is previewed.
+_PREVIEW_DEBOUNCE_MS = 150
+# Milliseconds between progress polls while a conversion runs.
+_PROGRESS_POLL_MS = 50
+# Seconds a failed soffice PATH lookup is trusted before checking again.
+_SOFFICE_CACHE_TTL = 5.0
+# Seconds an output folder that passed the write check is trusted.
+_WRITABLE_CACHE_TTL = 5.0
+
+
+# A line that markdown-it would render as plain paragraph text: no line
+# breaks, no inline or block syntax characters, no ordered list marker.
+_PLAIN_LINE_RE = re.compile(r"(?!\d+[.)])[^\n\r\x00#*_`\[\]!<>|\\&~+\-=:]*")
+
+# Rendered previews by digest of their Markdown, least recently used first.
+_PREVIEW_CACHE_SIZE = 64
+_PREVIEW_CACHE: OrderedDict[bytes, str] = OrderedDict()
+# Previews render on worker threads.
+_PREVIEW_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_md_parser() -> MarkdownIt:
+    # Built once, on the first preview rather than at startup; parsing is the
+    # only per-call cost.
+    from markdown_it import MarkdownIt
+
+    return MarkdownIt("commonmark", {"html": False}).enable(["table", "strikethrough"])
+
+_INLINE_MARKERS = {
+    "strong_open": "**",
+    "strong_close": "**",
+    "em_open": "*",
+    "em_close": "*",
+    "s_open": "~~",
+    "s_close": "~~",
+}
+
+
+def _inline_text(tokens: list[Token]) -> str:
+    """Plain text of every inline token in a block, markup dropped."""
+    parts = []
+    for token in tokens:
+        if token.type == "inline":
+            text = "".join(
+                " " if child.type in ("softbreak", "hardbreak") else child.content
+                for child in token.children or []
+            ).strip()
+            if text:
+                parts.append(text)
+    return " ".join(parts)
+
+
+def _format_inline(token: Token) -> str:
+    """Inline text of a paragraph with emphasis, code and links kept visible."""
+    out = []
+    hrefs = []
+    for child in token.children or []:
+        kind = child.type
+        if kind in _INLINE_MARKERS:
+            out.append(_INLINE_MARKERS[kind])
+        elif kind == "code_inline":
+            out.append(f"`{child.content}`")
+        elif kind == "link_open":
+            hrefs.append(str(child.attrs.get("href", "")))
+            out.append("[")
+        elif kind == "link_close":
+            out.append(f"]({hrefs.pop()})")
+        elif kind in ("softbreak", "hardbreak"):
+            out.append("\n")
+        else:
+            out.append(child.content)
+    return "".join(out).strip()
+
+
+def _heading_lines(token: Token, inner: list[Token]) -> Iterator[str]:
+    text = _inline_text(inner)
+    if text:
+        yield f"{'#' * int(token.tag[1])} {text}"
+        yield ""
+
+
+def _paragraph_lines(token: Token, inner: list[Token]) -> Iterator[str]:
+    text = _format_inline(inner[0])
+    if text:
+        yield text
+        yield ""
+
+
+def _list_lines(token: Token, inner: list[Token]) -> Iterator[str]:
+    # One line per top-level item; nested items fold into their parent.
+    items: list[list[Token]] = []
+    for t in inner:
+        if t.type == "list_item_open" and t.level == token.level + 1:
+            items.append([])
+        elif items:
+            items[-1].append(t)
+    for item in items:
+        text = _inline_text(item)
+        if text:
+            yield f"- {text}"
+
+
+def _blockquote_lines(token: Token, inner: list[Token]) -> Iterator[str]:
+    text = _inline_text(inner)
+    if text:
+        yield f"> {text}"
+        yield ""
+
+
+def _table_lines(token: Token, inner: list[Token]) -> Iterator[str]:
+    row: list[str] = []
+    for t in inner:
+        if t.type == "inline":
+            row.append(_inline_text([t]))
+        elif t.type == "tr_close":
+            yield f"| {' | '.join(row)} |"
+            row = []
+    yield ""
+
+
+def _code_lines(token: Token, inner: list[Token]) -> Iterator[str]:
+    yield "```"
+    for line in token.content.split("\n"):
+        yield f"    {line}"
+    yield "```"
+
+
+def _hr_lines(token: Token, inner: list[Token]) -> Iterator[str]:
+    yield "---"
+    yield ""
+
+
+# Preview lines for each top-level block, by the type of its opening token.
+_BLOCK_HANDLERS: dict[str, Callable[[Token, list[Token]], Iterator[str]]] = {
+    "heading_open": _heading_lines,
+    "paragraph_open": _paragraph_lines,
+    "bullet_list_open": _list_lines,
+    "ordered_list_open": _list_lines,
+    "blockquote_open": _blockquote_lines,
+    "table_open": _table_lines,
+    "fence": _code_lines,
+    "code_block": _code_lines,
+    "hr": _hr_lines,
+}
+
+
+def _format_markdown(md_text: str) -> str:
+    """Render Markdown into the plain formatted text shown in the preview."""
+    if not md_text:
+        return ""
+
+    # markdown-it yields a flat token stream; walk the top-level blocks and
+    # format each from the tokens between its open and close.
+    tokens = _get_md_parser().parse(md_text)
+    buf = io.StringIO()
+    prev_blank = True
+
+    def emit(lines: Iterator[str]) -> None:
+        # Write lines as they come, never two blank ones in a row.
+        nonlocal prev_blank
+        for line in lines:
+            blank = not line
+            if not (blank and prev_blank):
+                buf.write(line)
+                buf.write("\n")
+            prev_blank = blank
+
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token.nesting == 1:
+            end = i + 1
+            while not (tokens[end].nesting == -1 and tokens[end].level == token.level):
+                end += 1
+            inner = tokens[i + 1 : end]
+            i = end + 1
+        else:
+            inner = []
+            i += 1
 
-    # Final progress update
-    if progress_callback:
-        progress_callback(total_files, total_files, Path(""))
+        handler = _BLOCK_HANDLERS.get(token.type)
+        if handler is not None:
+            emit(handler(token, inner))
 
-    # Best-effort cleanup
-    try:
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
-    except Exception:
-        pass
-
-    return ConversionReport(
-        converted=converted,
-        skipped=skipped,
-        failed=failed,
-        failures=tuple(failures),
-    )
+    return buf.getvalue().strip()
 
 
 class DocsToMarkdownGUI:
@@ -149,10 +334,38 @@ class DocsToMarkdownGUI:
         self._conversion_thread: threading.Thread | None = None
         self._stop_conversion = threading.Event()
         self._current_markdown_text: str = ""
+        # Bumped on every preview request; stale renders are dropped.
+        self._preview_seq = 0
+        # Pending after() id of a debounced preview; see _on_file_selected().
+        self._preview_after_id: str | None = None
+        # Folder shown in the converted files list and its rows as sorted
+        # (casefolded path, path) keys.
+        self._listed_output_path: Path | None = None
+        self._listed_keys: list[tuple[str, str]] = []
+        # One long-lived worker reads and renders previews in request order.
+        self._preview_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="preview"
+        )
+        # Load the Markdown parser in the background so the first preview
+        # does not pay for the import.
+        self._preview_executor.submit(_get_md_parser)
+        # Started on the first conversion that includes .doc files and kept
+        # running until the window closes.
+        self._soffice_pool: SofficePool | None = None
+        # Latest (fraction, status text) from the conversion thread and the
+        # last one shown; see _drain_progress().
+        self._pending_progress: tuple[float, str] | None = None
+        self._shown_progress: tuple[float, str] | None = None
+        # (timestamp, path) of the last soffice lookup; see _find_soffice().
+        self._soffice_cache: tuple[float, str | None] | None = None
+        # Output folder -> monotonic time it last passed the write check.
+        self._writable_outputs: dict[str, float] = {}
+        self._find_soffice()
 
         # Build UI
         self._setup_layout()
         self._setup_drag_drop()
+        self._root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _render_markdown(self, md_text: str) -> str:
         """
@@ -167,169 +380,86 @@ class DocsToMarkdownGUI:
         if not md_text:
             return ""
 
-        # Convert markdown to HTML with extensions for better formatting
-        html = markdown.markdown(
-            md_text,
-            extensions=[
-                "extra",  # Tables, fenced code blocks, etc.
-                "nl2br",  # New line to <br>
-                "sane_lists",  # Better list handling
-            ],
-        )
-
-        # Parse HTML and convert to formatted text
-        soup = BeautifulSoup(html, "lxml")
-
-        # Build formatted text with tags for CTkTextbox
-        formatted_lines = []
-
-        # Helper function to recursively process elements
-        def process_element(element, depth=0):
-            """Recursively process HTML elements to build formatted text."""
-            lines = []
-
-            # Handle different element types
-            if element.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-                # Headers
-                level = int(element.name[1])
-                prefix = "#" * level + " "
-                text = element.get_text(strip=True)
-                if text:
-                    lines.append(f"{prefix}{text}")
-                    lines.append("")  # Add blank line after header
-            elif element.name == "p":
-                # Paragraph - process children inline
-                text_parts = []
-                for child in element.children:
-                    if hasattr(child, 'name'):
-                        if child.name in ["strong", "b"]:
-                            text_parts.append(f"**{child.get_text(strip=True)}**")
-                        elif child.name in ["em", "i"]:
-                            text_parts.append(f"*{child.get_text(strip=True)}*")
-                        elif child.name == "code":
-                            text_parts.append(f"`{child.get_text(strip=True)}`")
-                        elif child.name == "a":
-                            href = child.get("href", "")
-                            text = child.get_text(strip=True)
-                            if href:
-                                text_parts.append(f"[{text}]({href})")
-                            else:
-                                text_parts.append(text)
-                        else:
-                            text_parts.append(child.get_text(strip=True))
-                    else:
-                        # Text node
-                        text = str(child).strip()
-                        if text:
-                            text_parts.append(text)
-
-                paragraph_text = " ".join(text_parts)
-                if paragraph_text:
-                    lines.append(paragraph_text)
-                    lines.append("")  # Add blank line after paragraph
-            elif element.name == "ul" or element.name == "ol":
-                # Lists
-                for li in element.find_all("li", recursive=False):
-                    text = li.get_text(strip=True)
-                    if text:
-                        lines.append(f"- {text}")
-            elif element.name == "pre":
-                # Code block
-                code_text = element.get_text()
-                if code_text.strip():
-                    lines.append("```")
-                    for line in code_text.split("\n"):
-                        lines.append(f"    {line}")
-                    lines.append("```")
-            elif element.name == "blockquote":
-                # Blockquote
-                text = element.get_text(strip=True)
-                if text:
-                    lines.append(f"> {text}")
-                    lines.append("")
-            elif element.name == "hr":
-                # Horizontal rule
-                lines.append("---")
-                lines.append("")
-            elif element.name == "table":
-                # Table (basic support)
-                rows = element.find_all("tr")
-                if rows:
-                    for row in rows:
-                        cells = row.find_all(["th", "td"])
-                        if cells:
-                            row_text = " | ".join(cell.get_text(strip=True) for cell in cells)
-                            lines.append(f"| {row_text} |")
-                    lines.append("")
-
-            return lines
-
-        # Find the body element (BeautifulSoup wraps HTML in html/body tags)
-        body = soup.find("body")
-        if body:
-            # Process all top-level elements in body
-            for element in body.children:
-                if hasattr(element, 'name'):
-                    formatted_lines.extend(process_element(element))
-                else:
-                    # Text node at top level
-                    text = str(element).strip()
-                    if text:
-                        formatted_lines.append(text)
-        else:
-            # Fallback: process soup children directly
-            for element in soup.children:
-                if hasattr(element, 'name'):
-                    formatted_lines.extend(process_element(element))
-                else:
-                    text = str(element).strip()
-                    if text:
-                        formatted_lines.append(text)
-
-        # Join lines with newlines
-        formatted_text = "\n".join(formatted_lines)
-
-        # Clean up excessive blank lines
-        while "\n\n\n" in formatted_text:
-            formatted_text = formatted_text.replace("\n\n\n", "\n\n")
-
-        return formatted_text.strip()
+        # A single unindented line with no Markdown syntax renders as itself.
+        text = md_text.rstrip(" \t\r\n")
+        if (
+            text
+            and not text[0].isspace()
+            and not text[-1].isspace()
+            and _PLAIN_LINE_RE.fullmatch(text)
+        ):
+            return text
+
+        # Clicking back and forth between files renders the same text again;
+        # key on a digest so the cache does not hold every document's source.
+        key = hashlib.blake2b(md_text.encode("utf-8"), digest_size=16).digest()
+        with _PREVIEW_CACHE_LOCK:
+            formatted_text = _PREVIEW_CACHE.get(key)
+            if formatted_text is not None:
+                _PREVIEW_CACHE.move_to_end(key)
+                return formatted_text
+
+        formatted_text = _format_markdown(md_text)
+        with _PREVIEW_CACHE_LOCK:
+            _PREVIEW_CACHE[key] = formatted_text
+            if len(_PREVIEW_CACHE) > _PREVIEW_CACHE_SIZE:
+                _PREVIEW_CACHE.popitem(last=False)
+        return formatted_text
 
     def _show_preview(self, md_path: Path) -> None:
         """
         Display markdown file content in preview panel with proper formatting.
 
+        Reading and rendering run on the preview worker thread so large files
+        or slow disks do not freeze the window; only the latest request is
+        ever shown.
+
         Args:
             md_path: Path to markdown file to preview.
         """
+        self._preview_seq += 1
+        self._preview_executor.submit(self._preview_worker, md_path, self._preview_seq)
+
+    def _preview_worker(self, md_path: Path, seq: int) -> None:
+        """Read and render a preview off the UI thread."""
+        if seq != self._preview_seq:
+            # Another file was clicked while this request waited its turn.
+            return
+
         try:
             if not md_path.exists() or not md_path.is_file():
-                messagebox.showerror(
-                    "Error",
-                    f"File not found: {md_path}",
-                )
+                self._root.after(0, self._preview_failed, seq, f"File not found: {md_path}")
                 return
 
             # Read markdown content
             md_text = md_path.read_text(encoding="utf-8")
 
-            # Store the original markdown text for copy functionality
-            self._current_markdown_text = md_text
-
             # Render markdown with proper formatting
             formatted_text = self._render_markdown(md_text)
+        except Exception as e:
+            self._root.after(0, self._preview_failed, seq, f"Failed to preview file: {e}")
+            return
 
-            # Update preview textbox
-            self._preview_text.configure(state="normal")
-            self._preview_text.delete("1.0", "end")
-            self._preview_text.insert("1.0", formatted_text)
-            self._preview_text.configure(state="disabled")
+        self._root.after(0, self._apply_preview, seq, md_text, formatted_text)
 
-        except Exception as e:
-            messagebox.showerror(
-                "Error",
-                f"Failed to preview file: {e}",
-            )
+    def _apply_preview(self, seq: int, md_text: str, formatted_text: str) -> None:
+        """Show a rendered preview unless a newer one was requested since."""
+        if seq != self._preview_seq:
+            return
+
+        # Store the original markdown text for copy functionality
+        self._current_markdown_text = md_text
+
+        # Update preview textbox
+        self._preview_text.configure(state="normal")
+        self._preview_text.delete("1.0", "end")
+        self._preview_text.insert("1.0", formatted_text)
+        self._preview_text.configure(state="disabled")
+
+    def _preview_failed(self, seq: int, message: str) -> None:
+        """Report a preview error unless a newer preview was requested since."""
+        if seq == self._preview_seq:
+            messagebox.showerror("Error", message)
 
     def _copy_preview(self) -> None:
         """
@@ -488,7 +618,7 @@ class DocsToMarkdownGUI:
             checkboxes_frame,
             text="Include .doc files (requires LibreOffice)",
             variable=self._include_doc_var,
-            command=self._update_options,
+            command=self._on_include_doc_toggled,
         )
         include_doc_cb.pack(anchor="w", padx=10, pady=5)
 
@@ -593,12 +723,21 @@ class DocsToMarkdownGUI:
         )
         file_browser_label.pack(anchor="w", padx=5, pady=(5, 0))
 
-        # Create scrollable listbox for converted files
-        self._files_listbox = ctk.CTkScrollableFrame(
-            file_browser_frame,
-            height=100,
+        # Treeview only draws the rows in view, so long file lists stay cheap
+        files_list_frame = ctk.CTkFrame(file_browser_frame, fg_color="transparent")
+        files_list_frame.pack(fill="x", padx=5, pady=5)
+
+        self._files_tree = ttk.Treeview(
+            files_list_frame,
+            show="tree",
+            selectmode="browse",
+            height=5,
         )
-        self._files_listbox.pack(fill="x", padx=5, pady=5)
+        files_scrollbar = ctk.CTkScrollbar(files_list_frame, command=self._files_tree.yview)
+        self._files_tree.configure(yscrollcommand=files_scrollbar.set)
+        self._files_tree.pack(side="left", fill="x", expand=True)
+        files_scrollbar.pack(side="right", fill="y")
+        self._files_tree.bind("<<TreeviewSelect>>", self._on_file_selected)
 
         # Copy button frame
         copy_button_frame = ctk.CTkFrame(preview_frame)
@@ -623,36 +762,60 @@ class DocsToMarkdownGUI:
 
     def _update_files_list(self, output_path: Path) -> None:
         """
-        Update the files listbox with converted markdown files.
+        Update the files list with converted markdown files.
+
+        Rows are kept between calls for the same folder: only files that
+        appeared or disappeared since the last update are touched.
 
         Args:
             output_path: Path to output directory containing converted files.
         """
-        # Clear existing file buttons
-        for widget in self._files_listbox.winfo_children():
-            widget.destroy()
-
-        if not output_path.exists() or not output_path.is_dir():
-            return
-
-        # Find all .md files in output directory
-        md_files = list(output_path.rglob("*.md"))
-        md_files.sort(key=lambda x: str(x).lower())
+        if output_path != self._listed_output_path:
+            # Different folder: start over
+            self._files_tree.delete(*self._files_tree.get_children())
+            self._listed_keys = []
+            self._listed_output_path = output_path
+
+        # Find all .md files in output directory with the converter's
+        # scandir walk
+        paths: set[str] = set()
+        if output_path.is_dir():
+            paths = set(_walk_input_files(output_path, recursive=True, exts={".md"}))
+
+        listed = {path for _, path in self._listed_keys}
+        gone = listed - paths
+        if gone:
+            self._files_tree.delete(*gone)
+            self._listed_keys = [key for key in self._listed_keys if key[1] not in gone]
+
+        # Insert each new file at its sorted position, keyed by its full path
+        for path in sorted(paths - listed, key=str.casefold):
+            key = (path.casefold(), path)
+            index = bisect.bisect(self._listed_keys, key)
+            self._listed_keys.insert(index, key)
 
-        # Add clickable buttons for each file
-        for md_file in md_files:
             # Calculate relative path for display
             try:
-                rel_path = md_file.relative_to(output_path)
+                rel_path = Path(path).relative_to(output_path)
             except ValueError:
-                rel_path = md_file.name
+                rel_path = Path(path).name
 
-            file_btn = ctk.CTkButton(
-                self._files_listbox,
-                text=str(rel_path),
-                command=lambda f=md_file: self._show_preview(f),
-            )
-            file_btn.pack(fill="x", pady=2)
+            self._files_tree.insert("", index, iid=path, text=str(rel_path))
+
+    def _on_file_selected(self, event: object) -> None:
+        """Preview the selected file once the selection settles."""
+        # Holding an arrow key fires a select per row; only the row the user
+        # stops on is read and rendered.
+        if self._preview_after_id is not None:
+            self._root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self._root.after(_PREVIEW_DEBOUNCE_MS, self._preview_selected)
+
+    def _preview_selected(self) -> None:
+        """Preview the file selected in the converted files list."""
+        self._preview_after_id = None
+        selection = self._files_tree.selection()
+        if selection:
+            self._show_preview(Path(selection[0]))
 
     def _setup_drag_drop(self) -> None:
         """Configure drag-and-drop functionality."""
@@ -702,7 +865,7 @@ class DocsToMarkdownGUI:
 
                     # Validate file type
                     ext = input_path.suffix.lower()
-                    if ext not in {".doc", ".docx"}:
+                    if ext not in _WORD_EXTS:
                         messagebox.showerror(
                             "Invalid File Type",
                             f"Selected file is not a Word document (.doc/.docx).\n\n"
@@ -715,8 +878,7 @@ class DocsToMarkdownGUI:
 
                     # If it's a .doc file, check LibreOffice availability
                     if ext == ".doc":
-                        soffice = shutil.which("soffice") or shutil.which("soffice.exe")
-                        if not soffice:
+                        if not self._find_soffice():
                             messagebox.showwarning(
                                 "LibreOffice Not Found",
                                 f"Selected file is a .doc file, but LibreOffice was not found.\n\n"
@@ -754,8 +916,7 @@ class DocsToMarkdownGUI:
                         return
 
                     # Check if folder contains valid files
-                    has_docx = any(input_path.glob("*.docx")) or any(input_path.glob("*.DOCX"))
-                    has_doc = any(input_path.glob("*.doc")) or any(input_path.glob("*.DOC"))
+                    has_docx, has_doc = _scan_for_word_docs(input_path)
 
                     if not has_docx and not has_doc:
                         messagebox.showerror(
@@ -768,8 +929,7 @@ class DocsToMarkdownGUI:
 
                     # If folder contains .doc files, warn about LibreOffice
                     if has_doc:
-                        soffice = shutil.which("soffice") or shutil.which("soffice.exe")
-                        if not soffice:
+                        if not self._find_soffice():
                             messagebox.showwarning(
                                 "LibreOffice Not Found",
                                 f"Selected folder contains .doc files, but LibreOffice was not found.\n\n"
@@ -855,6 +1015,12 @@ class DocsToMarkdownGUI:
         self._include_doc = self._include_doc_var.get()
         self._overwrite = self._overwrite_var.get()
 
+    def _on_include_doc_toggled(self) -> None:
+        """Update options and look for LibreOffice again when .doc is enabled."""
+        self._update_options()
+        if self._include_doc:
+            self._find_soffice(rescan=True)
+
     def _on_drop(self, event: object) -> None:
         """Handle drag-and-drop event."""
         try:
@@ -869,21 +1035,25 @@ class DocsToMarkdownGUI:
             if not dropped_path:
                 return
 
-            input_path = Path(dropped_path).resolve()
+            abs_path = os.path.abspath(dropped_path)
 
-            # Validate the path exists
-            if not input_path.exists():
+            # Validate the path exists; one stat answers exists/is_file/is_dir
+            try:
+                mode = os.stat(abs_path).st_mode
+            except (FileNotFoundError, NotADirectoryError):
                 messagebox.showerror(
                     "Error",
                     f"Path does not exist: {dropped_path}",
                 )
                 return
 
+            input_path = Path(abs_path)
+
             # Handle file or folder
-            if input_path.is_file():
+            if stat.S_ISREG(mode):
                 # Validate file type
-                ext = input_path.suffix.lower()
-                if ext not in {".doc", ".docx"}:
+                ext = os.path.splitext(abs_path)[1].lower()
+                if ext not in _WORD_EXTS:
                     messagebox.showerror(
                         "Invalid File Type",
                         f"Dragged file is not a Word document (.doc/.docx).\n\n"
@@ -896,7 +1066,7 @@ class DocsToMarkdownGUI:
 
                 # If it's a .doc file, check LibreOffice availability
                 if ext == ".doc":
-                    soffice = shutil.which("soffice") or shutil.which("soffice.exe")
+                    soffice = self._find_soffice()
                     if not soffice:
                         messagebox.showwarning(
                             "LibreOffice Not Found",
@@ -912,10 +1082,9 @@ class DocsToMarkdownGUI:
                 self._input_entry.delete(0, "end")
                 self._input_entry.insert(0, str(input_path))
                 self._input_path = str(input_path)
-            elif input_path.is_dir():
+            elif stat.S_ISDIR(mode):
                 # Check if folder contains valid files
-                has_docx = any(input_path.glob("*.docx")) or any(input_path.glob("*.DOCX"))
-                has_doc = any(input_path.glob("*.doc")) or any(input_path.glob("*.DOC"))
+                has_docx, has_doc = _scan_for_word_docs(input_path)
 
                 if not has_docx and not has_doc:
                     messagebox.showerror(
@@ -928,7 +1097,7 @@ class DocsToMarkdownGUI:
 
                 # If folder contains .doc files, warn about LibreOffice
                 if has_doc:
-                    soffice = shutil.which("soffice") or shutil.which("soffice.exe")
+                    soffice = self._find_soffice()
                     if not soffice:
                         messagebox.showwarning(
                             "LibreOffice Not Found",
@@ -972,95 +1141,46 @@ class DocsToMarkdownGUI:
         Returns:
             Tuple of (is_valid, error_message). If is_valid is True, error_message is empty.
         """
-        # Validate input path exists
-        if not input_path.exists():
-            return False, f"Input path does not exist: {input_path}"
+        # Cheap checks run first and anything that touches the output folder
+        # runs last, so a bad input never creates or probes it.
+        input_is_file = input_path.is_file()
+        input_is_dir = not input_is_file and input_path.is_dir()
 
-        # Validate input path is either file or directory
-        if not input_path.is_file() and not input_path.is_dir():
+        # Validate input path exists and is either file or directory
+        if not input_is_file and not input_is_dir:
+            if not input_path.exists():
+                return False, f"Input path does not exist: {input_path}"
             return False, f"Input path is neither a file nor a directory: {input_path}"
 
         # If input is a file, validate it's a Word document
-        if input_path.is_file():
+        if input_is_file:
             ext = input_path.suffix.lower()
-            if ext not in {".doc", ".docx"}:
+            if ext not in _WORD_EXTS:
                 return False, (
                     f"Input file must be a Word document (.doc or .docx): {input_path.name}\n\n"
                     f"Selected file type: {ext or 'unknown'}\n"
                     f"Supported types: .doc, .docx"
                 )
 
-            # If it's a .doc file, validate LibreOffice is available
-            if ext == ".doc" or include_doc:
-                soffice = shutil.which("soffice") or shutil.which("soffice.exe")
-                if not soffice:
-                    return False, (
-                        f"LibreOffice is required to convert .doc files but was not found on PATH.\n\n"
-                        f"Please install LibreOffice and ensure 'soffice' is available, or select a .docx file instead.\n\n"
-                        f"Download LibreOffice: https://www.libreoffice.org/download/"
-                    )
-
-        # Validate LibreOffice is available if .doc files are included
-        if include_doc:
-            soffice = shutil.which("soffice") or shutil.which("soffice.exe")
-            if not soffice:
+        # Validate LibreOffice is available if a .doc file will be converted;
+        # a lone .docx file never needs it
+        if _needs_soffice(input_path, input_is_file, include_doc) and not self._find_soffice():
+            if input_is_file:
                 return False, (
-                    "LibreOffice is required to convert .doc files but was not found on PATH.\n\n"
-                    "Please install LibreOffice and ensure 'soffice' is available, or disable 'Include .doc files' option.\n\n"
-                    "Download LibreOffice: https://www.libreoffice.org/download/"
+                    f"LibreOffice is required to convert .doc files but was not found on PATH.\n\n"
+                    f"Please install LibreOffice and ensure 'soffice' is available, or select a .docx file instead.\n\n"
+                    f"Download LibreOffice: https://www.libreoffice.org/download/"
                 )
-
-        # Validate output path is a directory (or can be created as one)
-        if output_path.exists() and not output_path.is_dir():
-            return False, f"Output path exists but is not a directory: {output_path}"
-
-        # Validate output path is not inside input path (to avoid circular references)
-        try:
-            output_path.relative_to(input_path)
             return False, (
-                f"Output folder cannot be inside the input folder.\n\n"
-                f"Please choose a different output location."
+                "LibreOffice is required to convert .doc files but was not found on PATH.\n\n"
+                "Please install LibreOffice and ensure 'soffice' is available, or disable 'Include .doc files' option.\n\n"
+                "Download LibreOffice: https://www.libreoffice.org/download/"
             )
-        except ValueError:
-            # output_path is not relative to input_path, which is good
-            pass
-
-        # Validate output path can be written to
-        try:
-            if not output_path.exists():
-                output_path.mkdir(parents=True, exist_ok=True)
-            # Try to create a test file to verify write permissions
-            test_file = output_path / ".__write_test__"
-            test_file.touch()
-            test_file.unlink()
-        except PermissionError:
-            return False, (
-                f"Cannot write to output folder due to insufficient permissions.\n\n"
-                f"Output folder: {output_path}\n\n"
-                f"Possible solutions:\n"
-                f"- Choose a different output folder\n"
-                f"- Run the application with administrator privileges\n"
-                f"- Check folder permissions in Windows Explorer"
-            )
-        except OSError as e:
-            if "read-only" in str(e).lower() or "permission denied" in str(e).lower():
-                return False, (
-                    f"Cannot write to output folder - the location may be read-only.\n\n"
-                    f"Output folder: {output_path}\n\n"
-                    f"Possible solutions:\n"
-                    f"- Choose a different output folder\n"
-                    f"- Run the application with administrator privileges\n"
-                    f"- Check folder properties to ensure it's not marked as read-only"
-                )
-            return False, f"Cannot access output folder: {e}"
-        except Exception as e:
-            return False, f"Cannot access output folder: {e}"
 
         # If input is a directory, validate it contains valid files
-        if input_path.is_dir():
-            # Check if directory contains any .docx files
-            has_docx = any(input_path.glob("*.docx")) or any(input_path.glob("*.DOCX"))
-            has_doc = any(input_path.glob("*.doc")) or any(input_path.glob("*.DOC"))
+        if input_is_dir:
+            # Check if directory contains any Word documents
+            has_docx, has_doc = _scan_for_word_docs(input_path)
 
             if not has_docx and not has_doc:
                 return False, (
@@ -1079,6 +1199,56 @@ class DocsToMarkdownGUI:
                     f"Note: Only .docx files will be converted with current settings."
                 )
 
+        # Validate output path is not inside input path (to avoid circular references).
+        # Symlinks are not resolved yet; _run_conversion checks again once
+        # they are.
+        if _is_same_or_inside(output_path, input_path):
+            return False, _OUTPUT_INSIDE_INPUT_ERROR
+
+        # Validate output path is a directory (or can be created as one)
+        if output_path.exists() and not output_path.is_dir():
+            return False, f"Output path exists but is not a directory: {output_path}"
+
+        # Validate output path can be written to (a folder that passed a
+        # moment ago is not probed again)
+        output_key = os.fspath(output_path)
+        checked_at = self._writable_outputs.get(output_key)
+        if checked_at is None or time.monotonic() - checked_at >= _WRITABLE_CACHE_TTL:
+            try:
+                created = False
+                if not output_path.exists():
+                    output_path.mkdir(parents=True, exist_ok=True)
+                    created = True
+                # access() is a single syscall but cannot see every ACL, so a test
+                # file is still written when it says no or the folder is new.
+                if created or not os.access(output_path, os.W_OK):
+                    test_file = output_path / ".__write_test__"
+                    test_file.touch()
+                    test_file.unlink()
+            except PermissionError:
+                return False, (
+                    f"Cannot write to output folder due to insufficient permissions.\n\n"
+                    f"Output folder: {output_path}\n\n"
+                    f"Possible solutions:\n"
+                    f"- Choose a different output folder\n"
+                    f"- Run the application with administrator privileges\n"
+                    f"- Check folder permissions in Windows Explorer"
+                )
+            except OSError as e:
+                if "read-only" in str(e).lower() or "permission denied" in str(e).lower():
+                    return False, (
+                        f"Cannot write to output folder - the location may be read-only.\n\n"
+                        f"Output folder: {output_path}\n\n"
+                        f"Possible solutions:\n"
+                        f"- Choose a different output folder\n"
+                        f"- Run the application with administrator privileges\n"
+                        f"- Check folder properties to ensure it's not marked as read-only"
+                    )
+                return False, f"Cannot access output folder: {e}"
+            except Exception as e:
+                return False, f"Cannot access output folder: {e}"
+            self._writable_outputs[output_key] = time.monotonic()
+
         return True, ""
 
     def _start_conversion(self) -> None:
@@ -1089,12 +1259,14 @@ class DocsToMarkdownGUI:
             messagebox.showerror("Error", "Please select an input file or folder.")
             return
 
-        input_path = Path(input_str).resolve()
+        # abspath only normalizes the string; symlinks are resolved on the
+        # conversion thread so the UI thread makes no readlink calls.
+        input_path = Path(os.path.abspath(input_str))
 
         # Determine output path
         output_str = self._output_entry.get().strip()
         if output_str:
-            output_path = Path(output_str).resolve()
+            output_path = Path(os.path.abspath(output_str))
         else:
             # Default: create "markdown" subfolder next to input
             if input_path.is_file():
@@ -1125,24 +1297,32 @@ class DocsToMarkdownGUI:
             messagebox.showerror("Error", f"Cannot create output folder: {e}")
             return
 
+        # The pool is created here rather than on the conversion thread, so
+        # _on_close(), which runs on this thread too, always sees it.
+        soffice_pool = (
+            self._get_soffice_pool()
+            if _needs_soffice(input_path, input_path.is_file(), include_doc)
+            else None
+        )
+
         # Update UI state
         self._convert_btn.configure(state="disabled")
         self._cancel_btn.configure(state="normal")
         self._progress_bar.set(0)
         self._status_label.configure(text="Starting conversion...", text_color="blue")
-        self._results_text.configure(state="normal")
-        self._results_text.delete("1.0", "end")
-        self._results_text.insert("1.0", "Conversion in progress...\n")
-        self._results_text.configure(state="disabled")
+        self._set_results_text("Conversion in progress...\n")
         self._stop_conversion.clear()
 
         # Start conversion in background thread
         self._conversion_thread = threading.Thread(
             target=self._run_conversion,
-            args=(input_path, output_path, recursive, include_doc, overwrite),
+            args=(input_path, output_path, recursive, include_doc, overwrite, soffice_pool),
             daemon=True,
         )
+        self._pending_progress = None
+        self._shown_progress = None
         self._conversion_thread.start()
+        self._root.after(_PROGRESS_POLL_MS, self._drain_progress)
 
     def _run_conversion(
         self,
@@ -1151,56 +1331,30 @@ class DocsToMarkdownGUI:
         recursive: bool,
         include_doc: bool,
         overwrite: bool,
+        soffice_pool: SofficePool | None,
     ) -> None:
         """Run conversion in background thread and update UI."""
         try:
+            input_path = input_path.resolve()
+            output_path = output_path.resolve()
+            # An output folder reached through a symlink may still lie inside
+            # the input folder.
+            if _is_same_or_inside(output_path, input_path):
+                raise ValueError(_OUTPUT_INSIDE_INPUT_ERROR)
             # Save output path for file browser
             self._last_output_path = output_path
+            input_is_file = input_path.is_file()
 
-            if input_path.is_file():
-                # Single file conversion - create temp folder structure
-                temp_dir = output_path / ".__temp_single_file__"
-                temp_dir.mkdir(parents=True, exist_ok=True)
-
-                # Copy file to temp dir to use convert_folder
-                temp_file = temp_dir / input_path.name
-                try:
-                    shutil.copy2(input_path, temp_file)
-                except PermissionError:
-                    raise RuntimeError(
-                        f"Permission denied when copying file: {input_path}\n\n"
-                        f"Possible causes:\n"
-                        f"- File is open in another application\n"
-                        f"- Insufficient permissions to read the file\n"
-                        f"- File is located in a protected system folder"
-                    )
-                except OSError as e:
-                    if "read-only" in str(e).lower():
-                        raise RuntimeError(
-                            f"Cannot copy file - it may be read-only or in use: {input_path}\n\n"
-                            f"Please close any applications using this file and try again."
-                        )
-                    raise RuntimeError(
-                        f"Failed to copy input file to temporary directory: {e}"
-                    )
-
-                # Run conversion on temp folder with progress tracking
-                try:
-                    report = convert_folder_with_progress(
-                        input_dir=temp_dir,
-                        output_dir=output_path,
-                        recursive=recursive,
-                        include_doc=include_doc,
-                        overwrite=overwrite,
-                        progress_callback=self._update_progress,
-                        stop_event=self._stop_conversion,
-                    )
-                finally:
-                    # Cleanup temp dir
-                    try:
-                        shutil.rmtree(temp_dir)
-                    except Exception:
-                        pass
+            if input_is_file:
+                # Single file conversion straight into the output folder
+                report = convert_file(
+                    input_file=input_path,
+                    output_dir=output_path,
+                    overwrite=overwrite,
+                    progress_callback=self._update_progress,
+                    stop_event=self._stop_conversion,
+                    soffice_pool=soffice_pool,
+                )
             else:
                 # Folder conversion with progress tracking
                 report = convert_folder_with_progress(
@@ -1211,17 +1365,20 @@ class DocsToMarkdownGUI:
                     overwrite=overwrite,
                     progress_callback=self._update_progress,
                     stop_event=self._stop_conversion,
+                    soffice_pool=soffice_pool,
                 )
 
             # Update UI with results
-            self._root.after(0, lambda: self._on_conversion_complete(report, None))
+            self._root.after(0, self._on_conversion_complete, report, None)
 
         except ValueError as e:
             # Input validation errors from converter
-            self._root.after(0, lambda: self._on_conversion_complete(None, e))
+            self._root.after(0, self._on_conversion_complete, None, e)
         except PermissionError as e:
             # Permission-related errors
-            self._root.after(0, lambda: self._on_conversion_complete(
+            self._root.after(
+                0,
+                self._on_conversion_complete,
                 None,
                 RuntimeError(
                     f"Permission denied during conversion.\n\n"
@@ -1232,12 +1389,14 @@ class DocsToMarkdownGUI:
                     f"- Check file/folder permissions\n"
                     f"- Ensure no other program is using the files"
                 )
-            ))
+            )
         except RuntimeError as e:
             # Runtime errors (e.g., LibreOffice not found)
             error_msg = str(e)
             if "LibreOffice" in error_msg or "soffice" in error_msg:
-                self._root.after(0, lambda: self._on_conversion_complete(
+                self._root.after(
+                    0,
+                    self._on_conversion_complete,
                     None,
                     RuntimeError(
                         f"LibreOffice conversion failed.\n\n"
@@ -1248,43 +1407,51 @@ class DocsToMarkdownGUI:
                         f"- Disable 'Include .doc files' option if you only have .docx files\n"
                         f"- Restart the application after installing LibreOffice"
                     )
-                ))
+                )
             else:
-                self._root.after(0, lambda: self._on_conversion_complete(None, e))
+                self._root.after(0, self._on_conversion_complete, None, e)
         except OSError as e:
             # OS-level errors (disk full, file in use, etc.)
             error_msg = str(e).lower()
             if "disk full" in error_msg or "no space" in error_msg:
-                self._root.after(0, lambda: self._on_conversion_complete(
+                self._root.after(
+                    0,
+                    self._on_conversion_complete,
                     None,
                     RuntimeError(
                         f"Disk full - not enough space to complete conversion.\n\n"
                         f"Please free up disk space and try again."
                     )
-                ))
+                )
             elif "file in use" in error_msg or "being used" in error_msg:
-                self._root.after(0, lambda: self._on_conversion_complete(
+                self._root.after(
+                    0,
+                    self._on_conversion_complete,
                     None,
                     RuntimeError(
                         f"File is in use by another application.\n\n"
                         f"Please close any applications using the files and try again."
                     )
-                ))
+                )
             else:
-                self._root.after(0, lambda: self._on_conversion_complete(
+                self._root.after(
+                    0,
+                    self._on_conversion_complete,
                     None,
                     RuntimeError(f"System error during conversion: {e}")
-                ))
+                )
         except Exception as e:
             # Unexpected errors
-            self._root.after(0, lambda: self._on_conversion_complete(
+            self._root.after(
+                0,
+                self._on_conversion_complete,
                 None,
                 RuntimeError(
                     f"Unexpected error during conversion.\n\n"
                     f"Error: {type(e).__name__}: {e}\n\n"
                     f"Please try again or report this issue if it persists."
                 )
-            ))
+            )
 
     def _update_progress(self, current: int, total: int, current_file: Path) -> None:
         """
@@ -1307,39 +1474,55 @@ class DocsToMarkdownGUI:
         else:
             status_text = "Conversion complete"
 
-        # Schedule UI updates on main thread
-        self._root.after(0, lambda: self._progress_bar.set(progress))
-        self._root.after(0, lambda: self._status_label.configure(
-            text=status_text,
-            text_color="blue",
-        ))
+        # Only publish the latest values. Calling into Tk from this thread
+        # would wait for the main loop, so a busy UI would stall conversion;
+        # the main thread picks the values up in _drain_progress instead.
+        self._pending_progress = (progress, status_text)
+
+    def _drain_progress(self) -> None:
+        """Show the latest progress update; polls on the main thread while converting."""
+        pending = self._pending_progress
+        if pending is not None and pending is not self._shown_progress:
+            self._shown_progress = pending
+            progress, status_text = pending
+            self._progress_bar.set(progress)
+            self._status_label.configure(text=status_text, text_color="blue")
+        if self._conversion_thread is not None and self._conversion_thread.is_alive():
+            self._root.after(_PROGRESS_POLL_MS, self._drain_progress)
 
     def _on_conversion_complete(self, report: ConversionReport | None, error: Exception | None) -> None:
         """Handle conversion completion."""
+        # The final status below must not be overwritten by a progress poll.
+        self._pending_progress = None
+
         # Update UI state
         self._convert_btn.configure(state="normal")
         self._cancel_btn.configure(state="disabled")
         self._progress_bar.set(1)
 
+        # The counts appear in both the results box and the dialog.
+        counts = (
+            f"Converted: {report.converted}\nSkipped: {report.skipped}\nFailed: {report.failed}"
+            if report
+            else ""
+        )
+
         # Check if conversion was cancelled
         if self._stop_conversion.is_set():
             self._status_label.configure(text="Conversion cancelled", text_color="orange")
-            self._results_text.configure(state="normal")
-            self._results_text.delete("1.0", "end")
 
             if report:
-                result_text = f"Conversion cancelled by user.\n\n"
-                result_text += f"Converted: {report.converted}\n"
-                result_text += f"Skipped: {report.skipped}\n"
-                result_text += f"Failed: {report.failed}\n"
-                result_text += "\nPartial results have been preserved."
+                parts = [
+                    "Conversion cancelled by user.\n\n",
+                    counts,
+                    "\n\nPartial results have been preserved.",
+                ]
 
                 if report.failures:
-                    result_text += "\n\nFailures:\n"
-                    for failure in report.failures:
-                        result_text += f"  - {failure}\n"
+                    parts.append("\n\nFailures:\n")
+                    parts.extend(f"  - {failure}\n" for failure in report.failures)
 
-                self._results_text.insert("1.0", result_text)
+                self._set_results_text("".join(parts))
 
                 # Update files list with partially converted markdown files
                 if self._last_output_path:
@@ -1347,22 +1530,18 @@ class DocsToMarkdownGUI:
 
                 messagebox.showinfo(
                     "Cancelled",
-                    f"Conversion cancelled.\n\nConverted: {report.converted}\nSkipped: {report.skipped}\nFailed: {report.failed}\n\nPartial results have been preserved.",
+                    f"Conversion cancelled.\n\n{counts}\n\nPartial results have been preserved.",
                 )
             else:
-                self._results_text.insert("1.0", "Conversion cancelled by user.\nNo files were converted.")
+                self._set_results_text("Conversion cancelled by user.\nNo files were converted.")
                 messagebox.showinfo("Cancelled", "Conversion cancelled by user.\nNo files were converted.")
 
-            self._results_text.configure(state="disabled")
             self._stop_conversion.clear()
             return
 
         if error:
             self._status_label.configure(text="Conversion failed", text_color="red")
-            self._results_text.configure(state="normal")
-            self._results_text.delete("1.0", "end")
-            self._results_text.insert("1.0", f"Error: {error}\n")
-            self._results_text.configure(state="disabled")
+            self._set_results_text(f"Error: {error}\n")
             messagebox.showerror("Error", f"Conversion failed: {error}")
             return
 
@@ -1372,27 +1551,33 @@ class DocsToMarkdownGUI:
 
         # Display results
         self._status_label.configure(text="Conversion complete", text_color="green")
-        self._results_text.configure(state="normal")
-        self._results_text.delete("1.0", "end")
 
-        result_text = f"Conversion completed successfully!\n\n"
-        result_text += f"Converted: {report.converted}\n"
-        result_text += f"Skipped: {report.skipped}\n"
-        result_text += f"Failed: {report.failed}\n"
+        # Join once; repeated += copies the text for every failure.
+        parts = [
+            "Conversion completed successfully!\n\n",
+            counts,
+            "\n",
+        ]
 
         if report.failures:
-            result_text += "\nFailures:\n"
-            for failure in report.failures:
-                result_text += f"  - {failure}\n"
+            parts.append("\nFailures:\n")
+            parts.extend(f"  - {failure}\n" for failure in report.failures)
 
-        self._results_text.insert("1.0", result_text)
-        self._results_text.configure(state="disabled")
+        self._set_results_text("".join(parts))
 
         messagebox.showinfo(
             "Success",
-            f"Conversion complete!\n\nConverted: {report.converted}\nSkipped: {report.skipped}\nFailed: {report.failed}",
+            f"Conversion complete!\n\n{counts}",
         )
 
+    def _set_results_text(self, text: str) -> None:
+        """Replace the contents of the read-only results box."""
+        results = self._results_text
+        results.configure(state="normal")
+        results.delete("1.0", "end")
+        results.insert("1.0", text)
+        results.configure(state="disabled")
+
     def _cancel_conversion(self) -> None:
         """Cancel the running conversion."""
         if self._conversion_thread and self._conversion_thread.is_alive():
@@ -1402,14 +1587,57 @@ class DocsToMarkdownGUI:
             # Update UI to show cancellation in progress
             self._status_label.configure(text="Cancelling conversion...", text_color="orange")
             self._cancel_btn.configure(state="disabled")
-            self._results_text.configure(state="normal")
-            self._results_text.delete("1.0", "end")
-            self._results_text.insert("1.0", "Cancelling conversion...\n")
-            self._results_text.configure(state="disabled")
+            self._set_results_text("Cancelling conversion...\n")
         else:
             # No conversion running
             messagebox.showinfo("Info", "No conversion is currently running.")
 
+    def _find_soffice(self, *, rescan: bool = False) -> str | None:
+        """
+        Return the soffice path.
+
+        A path that was found is kept for the session; a failed lookup is
+        retried after a few seconds, or at once when rescan is set.
+        """
+        now = time.monotonic()
+        cache = self._soffice_cache
+        if (
+            rescan
+            or cache is None
+            or (cache[1] is None and now - cache[0] >= _SOFFICE_CACHE_TTL)
+        ):
+            # The converter memoizes the lookup too; refresh both together so
+            # a LibreOffice installed mid-session is picked up everywhere.
+            _find_soffice.cache_clear()
+            self._soffice_cache = (now, _find_soffice())
+        return self._soffice_cache[1]
+
+    def _get_soffice_pool(self) -> SofficePool | None:
+        """
+        Return the shared LibreOffice pool, creating it on first use.
+
+        Only call this on the UI thread, which is also where _on_close() closes
+        the pool.
+        """
+        if self._soffice_pool is None:
+            soffice = self._find_soffice()
+            if soffice:
+                self._soffice_pool = SofficePool(soffice)
+        return self._soffice_pool
+
+    def _on_close(self) -> None:
+        """Stop the LibreOffice pool, then close the window."""
+        self._stop_conversion.set()
+        if self._preview_after_id is not None:
+            self._root.after_cancel(self._preview_after_id)
+        self._preview_executor.shutdown(wait=False, cancel_futures=True)
+        if self._soffice_pool is not None:
+            # Each instance may take seconds to exit; don't hold the window
+            # open for it. The thread is not a daemon, so the process still
+            # waits for LibreOffice to be gone before exiting.
+            threading.Thread(target=self._soffice_pool.close, name="soffice-pool-close").start()
+        self._root.destroy()
+
     def run(self) -> None:
         """Start the GUI main loop."""
         self._root.mainloop()
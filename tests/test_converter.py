@@ -0,0 +1,800 @@
+import os
+import signal
+import stat
+import subprocess
+import sys
+import threading
+import time
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from docs_to_markdown import converter
+from docs_to_markdown.converter import (
+    ConversionCancelled,
+    SofficePool,
+    _LibreOfficeListener,
+    _extension_from_content_type,
+    _html_to_markdown,
+    _iter_doc_batches,
+    _run_soffice,
+    _write_bytes,
+    convert_file,
+    convert_folder,
+)
+
+
+@pytest.fixture
+def soffice_on_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make LibreOffice look installed."""
+    monkeypatch.setattr(converter, "_find_soffice", lambda: "soffice")
+
+
+@pytest.fixture
+def fake_convert(monkeypatch: pytest.MonkeyPatch) -> dict[str, list]:
+    """Stub out per-file conversion, which then always succeeds."""
+    # converted: names of the files handed to _convert_one, in call order.
+    # delay: seconds each conversion takes.
+    state: dict[str, list] = {"converted": [], "delay": [0.0]}
+
+    def convert_one(src: Path, **kwargs: object) -> tuple[str, str]:
+        state["converted"].append(src.name)
+        time.sleep(state["delay"][0])
+        return "ok", ""
+
+    monkeypatch.setattr(converter, "_convert_one", convert_one)
+    return state
+
+
+@pytest.fixture
+def hanging_soffice(
+    soffice_on_path: None, monkeypatch: pytest.MonkeyPatch
+) -> list[float | None]:
+    """Make every soffice run time out; returns the timeout of each run."""
+    timeouts: list[float | None] = []
+
+    def run_soffice(
+        cmd: list[str], *, timeout: float | None = None, **kwargs: object
+    ) -> tuple[int, str]:
+        timeouts.append(timeout)
+        raise subprocess.TimeoutExpired(cmd[0], timeout)
+
+    monkeypatch.setattr(converter, "_run_soffice", run_soffice)
+    return timeouts
+
+
+def test_convert_folder_parallel_reports_in_discovery_order(tmp_path: Path) -> None:
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    for name in ["c.docx", "a.docx", "b.docx"]:
+        (input_dir / name).write_bytes(b"PK\x03\x04")
+
+    report = convert_folder(input_dir=input_dir, output_dir=tmp_path / "out", max_workers=2)
+
+    assert report.converted == 0
+    assert report.failed == 3
+    assert [f.split(":", 1)[0] for f in report.failures] == [
+        str(input_dir / "a.docx"),
+        str(input_dir / "b.docx"),
+        str(input_dir / "c.docx"),
+    ]
+
+
+def test_convert_folder_skips_existing(tmp_path: Path) -> None:
+    input_dir = tmp_path / "in"
+    output_dir = tmp_path / "out"
+    input_dir.mkdir()
+    output_dir.mkdir()
+    (input_dir / "a.docx").write_bytes(b"PK\x03\x04")
+    (output_dir / "a.md").write_text("# Existing")
+
+    report = convert_folder(input_dir=input_dir, output_dir=output_dir)
+
+    assert report.skipped == 1
+    assert (output_dir / "a.md").read_text() == "# Existing"
+
+
+def test_convert_folder_skips_existing_in_other_case_on_case_insensitive_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    input_dir = tmp_path / "in"
+    output_dir = tmp_path / "out"
+    input_dir.mkdir()
+    output_dir.mkdir()
+    (input_dir / "a.docx").write_bytes(b"PK\x03\x04")
+    (output_dir / "A.md").write_text("# Existing")
+
+    # As on a default macOS (APFS) volume, where os.path.normcase is a no-op.
+    monkeypatch.setattr(converter, "_case_insensitive", lambda path: True)
+
+    report = convert_folder(input_dir=input_dir, output_dir=output_dir)
+
+    assert report.skipped == 1
+    assert (output_dir / "A.md").read_text() == "# Existing"
+
+
+def test_convert_folder_skips_inputs_that_share_an_output(
+    tmp_path: Path, fake_convert: dict[str, list], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    (input_dir / "a.docx").write_bytes(b"PK\x03\x04")
+    (input_dir / "a.DOCX").write_bytes(b"PK\x03\x04")
+    (input_dir / "b.docx").write_bytes(b"PK\x03\x04")
+
+    pool_sizes: list[int] = []
+    docx_executor = converter._docx_executor
+
+    def recording_executor(n_jobs: int, max_workers: int | None) -> object:
+        pool_sizes.append(n_jobs)
+        return docx_executor(n_jobs, max_workers)
+
+    monkeypatch.setattr(converter, "_docx_executor", recording_executor)
+
+    report = convert_folder(input_dir=input_dir, output_dir=tmp_path / "out", max_workers=1)
+
+    assert (report.converted, report.skipped) == (2, 1)
+    assert sorted(name.lower() for name in fake_convert["converted"]) == ["a.docx", "b.docx"]
+    # The pool is sized for the files left to convert, not all discovered.
+    assert pool_sizes == [2]
+
+
+def test_convert_folder_overwrite_converts_last_input_that_shares_an_output(
+    tmp_path: Path, fake_convert: dict[str, list]
+) -> None:
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    (input_dir / "a.doc").write_bytes(b"x")
+    (input_dir / "a.docx").write_bytes(b"PK\x03\x04")
+
+    report = convert_folder(
+        input_dir=input_dir, output_dir=tmp_path / "out", include_doc=True, overwrite=True
+    )
+
+    # As in a one-at-a-time run, the later a.docx ends up in a.md.
+    assert (report.converted, report.skipped) == (1, 1)
+    assert fake_convert["converted"] == ["a.docx"]
+
+
+def test_write_bytes_creates_file_with_umask_mode(tmp_path: Path) -> None:
+    dest = tmp_path / "a.md"
+    old_umask = os.umask(0o027)
+    try:
+        _write_bytes(dest, b"# New\n")
+    finally:
+        os.umask(old_umask)
+
+    assert dest.read_bytes() == b"# New\n"
+    if os.name == "posix":
+        assert stat.S_IMODE(dest.stat().st_mode) == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["a.md"]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+def test_write_bytes_replaces_existing_file_keeping_its_mode(tmp_path: Path) -> None:
+    dest = tmp_path / "a.md"
+    dest.write_bytes(b"# Old\n")
+    dest.chmod(0o600)
+
+    _write_bytes(dest, b"# New\n")
+
+    assert dest.read_bytes() == b"# New\n"
+    assert stat.S_IMODE(dest.stat().st_mode) == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == ["a.md"]
+
+
+def test_write_bytes_leaves_target_and_no_temp_file_on_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    dest = tmp_path / "a.md"
+    dest.write_bytes(b"# Old\n")
+
+    def failing_write(fd: int, data: object) -> int:
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(converter.os, "write", failing_write)
+
+    with pytest.raises(OSError, match="No space"):
+        _write_bytes(dest, b"# New\n")
+
+    assert dest.read_bytes() == b"# Old\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["a.md"]
+
+
+_DOCX_NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+    'xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing" '
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture"'
+)
+
+
+def _write_docx(path: Path, paragraphs: list[str], images: dict[str, bytes]) -> None:
+    """Write a minimal .docx; a paragraph "@name" embeds images[name] as a PNG."""
+    body = []
+    for text in paragraphs:
+        if text.startswith("@"):
+            body.append(
+                '<w:p><w:r><w:drawing><wp:inline><wp:extent cx="9525" cy="9525"/>'
+                '<wp:docPr id="1" name="picture"/><a:graphic>'
+                '<a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+                f'<pic:pic><pic:blipFill><a:blip r:embed="{text[1:]}"/></pic:blipFill></pic:pic>'
+                "</a:graphicData></a:graphic></wp:inline></w:drawing></w:r></w:p>"
+            )
+        else:
+            body.append(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>")
+    rels = "".join(
+        f'<Relationship Id="{name}" Target="media/{name}.png" Type='
+        '"http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"/>'
+        for name in images
+    )
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr(
+            "[Content_Types].xml",
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" '
+            'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Default Extension="png" ContentType="image/png"/></Types>',
+        )
+        z.writestr(
+            "_rels/.rels",
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Target="word/document.xml" Type='
+            '"http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+            "</Relationships>",
+        )
+        z.writestr(
+            "word/document.xml",
+            f"<w:document {_DOCX_NAMESPACES}><w:body>{''.join(body)}</w:body></w:document>",
+        )
+        z.writestr(
+            "word/_rels/document.xml.rels",
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f"{rels}</Relationships>",
+        )
+        for name, data in images.items():
+            z.writestr(f"word/media/{name}.png", data)
+
+
+def test_convert_folder_writes_repeated_images_once(tmp_path: Path) -> None:
+    input_dir = tmp_path / "in"
+    output_dir = tmp_path / "out"
+    input_dir.mkdir()
+    logo = b"\x89PNG logo"
+    photo = b"\x89PNG photo"
+    # "copy" is a second embedded part with the logo's bytes.
+    _write_docx(
+        input_dir / "my doc.docx",
+        ["Intro", "@logo", "@photo", "@copy", "@logo"],
+        {"logo": logo, "photo": photo, "copy": logo},
+    )
+
+    report = convert_folder(input_dir=input_dir, output_dir=output_dir)
+
+    assert report.converted == 1
+    assets = output_dir / "my doc_files"
+    assert sorted(p.name for p in assets.iterdir()) == ["image1.png", "image2.png"]
+    assert (assets / "image1.png").read_bytes() == logo
+    assert (assets / "image2.png").read_bytes() == photo
+    assert (output_dir / "my doc.md").read_text(encoding="utf-8") == (
+        "Intro\n\n"
+        "![](my doc_files/image1.png)\n\n"
+        "![](my doc_files/image2.png)\n\n"
+        "![](my doc_files/image1.png)\n\n"
+        "![](my doc_files/image1.png)\n"
+    )
+
+
+def test_convert_file_converts_in_place(tmp_path: Path) -> None:
+    src = tmp_path / "in" / "a.docx"
+    src.parent.mkdir()
+    src.write_bytes(b"PK\x03\x04")
+
+    report = convert_file(input_file=src, output_dir=tmp_path / "out")
+
+    assert report.failed == 1
+    assert report.failures[0].startswith(f"{src}:")
+    assert sorted(p.name for p in src.parent.iterdir()) == ["a.docx"]
+
+    (tmp_path / "notes.txt").write_text("x")
+    with pytest.raises(ValueError, match="Word document"):
+        convert_file(input_file=tmp_path / "notes.txt", output_dir=tmp_path / "out")
+
+
+def test_iter_doc_batches_splits_on_size_and_duplicate_stems(tmp_path: Path) -> None:
+    paths = [
+        tmp_path / "a.doc",
+        tmp_path / "b.doc",
+        tmp_path / "sub" / "A.DOC",
+        tmp_path / "c.doc",
+        tmp_path / "d.doc",
+    ]
+
+    batches = list(_iter_doc_batches(paths, batch_size=3))
+
+    assert batches == [paths[0:2], paths[2:5]]
+
+
+def test_extension_from_content_type() -> None:
+    assert _extension_from_content_type("image/png") == ".png"
+    assert _extension_from_content_type(" Image/JPEG ") == ".jpg"
+    assert _extension_from_content_type("image/x-emf; charset=binary") == ".x-emf"
+    assert _extension_from_content_type("") == ".bin"
+
+
+@pytest.fixture
+def parser_features(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record which parser _html_to_markdown hands each document to."""
+    import bs4
+
+    features: list[str] = []
+    soup = bs4.BeautifulSoup
+
+    def recording_soup(markup: str, parser: str) -> object:
+        features.append(parser)
+        return soup(markup, parser)
+
+    monkeypatch.setattr(bs4, "BeautifulSoup", recording_soup)
+    return features
+
+
+def test_html_to_markdown_skips_normalizing_plain_mammoth_html(
+    parser_features: list[str],
+) -> None:
+    html = (
+        "<h1>Title</h1><p>Some <strong>bold</strong> and <em>italic</em> text.</p>"
+        "<ul><li>one</li><li>two</li></ul><table><tr><td>a</td><td>b</td></tr></table>"
+    )
+
+    md = _html_to_markdown(html)
+
+    assert parser_features == ["html.parser"]
+    assert md == "\n# Title\n\nSome **bold** and *italic* text.\n\n- one\n- two\n\n| a | b |\n| --- | --- |\n\n"
+
+
+@pytest.mark.parametrize(
+    ("html", "expected"),
+    [
+        # Markdown produced by the old normalize-then-convert pipeline.
+        (
+            "<p>a<!-- note --><strong>bold<em>both</strong>italic</em></p>"
+            "<p>x<script>evil()</script>y</p>",
+            "\n\na**bold*both***italic\n\nxy\n\n",
+        ),
+        (
+            "<p>before<style>p{}</style><table><tr><td>a<p>b</td></tr></table>after</p>",
+            "\n\nbefore\n\n| a b |\n| --- |\n\nafter",
+        ),
+    ],
+    ids=["comment-script-misnested", "style-unclosed-cell"],
+)
+def test_html_to_markdown_normalizes_odd_html_with_lxml(
+    parser_features: list[str], html: str, expected: str
+) -> None:
+    assert _html_to_markdown(html) == expected
+    assert parser_features == ["lxml"]
+
+
+def test_convert_folder_requires_soffice_for_doc_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "a.doc").write_bytes(b"x")
+    monkeypatch.setattr(converter.shutil, "which", lambda name: None)
+    converter._find_soffice.cache_clear()
+    try:
+        with pytest.raises(RuntimeError, match="soffice"):
+            convert_folder(input_dir=tmp_path, output_dir=tmp_path / "out", include_doc=True)
+    finally:
+        converter._find_soffice.cache_clear()
+
+
+def test_convert_folder_stop_event_cancels_pending_files(
+    tmp_path: Path, fake_convert: dict[str, list]
+) -> None:
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    for i in range(20):
+        (input_dir / f"file{i:02}.docx").write_bytes(b"PK\x03\x04")
+
+    fake_convert["delay"][0] = 0.05
+    stop_event = threading.Event()
+    progress: list[tuple[int, int, str]] = []
+
+    def on_progress(current: int, total: int, current_file: Path) -> None:
+        progress.append((current, total, current_file.name))
+        stop_event.set()
+
+    report = convert_folder(
+        input_dir=input_dir,
+        output_dir=tmp_path / "out",
+        progress_callback=on_progress,
+        stop_event=stop_event,
+        max_workers=1,
+    )
+
+    assert 1 <= report.converted < 20
+    assert progress[0][:2] == (0, 20)
+    assert progress[-1] == (20, 20, "")
+
+
+def test_convert_folder_reports_progress_while_doc_batches_run(
+    tmp_path: Path,
+    soffice_on_path: None,
+    fake_convert: dict[str, list],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    (tmp_path / "a.docx").write_bytes(b"PK\x03\x04")
+    (tmp_path / "b.doc").write_bytes(b"x")
+    progress_seen = threading.Event()
+    batch_saw_progress: list[bool] = []
+
+    def slow_batch(cmd: list[str], **kwargs: object) -> tuple[int, str]:
+        # The .docx file must be reported before this soffice run ends.
+        batch_saw_progress.append(progress_seen.wait(5))
+        return 0, ""
+
+    monkeypatch.setattr(converter, "_run_soffice", slow_batch)
+
+    report = convert_folder(
+        input_dir=tmp_path,
+        output_dir=tmp_path / "out",
+        include_doc=True,
+        max_workers=1,
+        progress_callback=lambda current, total, path: progress_seen.set(),
+    )
+
+    assert batch_saw_progress == [True]
+    assert report.converted == 2
+
+
+def test_doc_retry_after_batch_timeout_is_time_limited(
+    tmp_path: Path, hanging_soffice: list[float | None]
+) -> None:
+    (tmp_path / "hung.doc").write_bytes(b"x")
+
+    report = convert_folder(input_dir=tmp_path, output_dir=tmp_path / "out", include_doc=True)
+
+    assert report.failed == 1
+    assert "timed out" in report.failures[0]
+    # The batch, then the one-at-a-time retry, each with a limit.
+    assert hanging_soffice == [converter._SOFFICE_TIMEOUT_PER_FILE] * 2
+
+
+def test_doc_to_docx_ignores_output_left_by_earlier_run(
+    tmp_path: Path, soffice_on_path: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "a.doc"
+    src.write_bytes(b"x")
+    work_dir = tmp_path / "work"
+    outdirs: list[str] = []
+
+    def soffice_writing_nothing(cmd: list[str], **kwargs: object) -> tuple[int, str]:
+        outdirs.append(cmd[cmd.index("--outdir") + 1])
+        return 0, ""
+
+    def soffice_writing_output(cmd: list[str], **kwargs: object) -> tuple[int, str]:
+        outdir = Path(cmd[cmd.index("--outdir") + 1])
+        (outdir / "a.docx").write_bytes(b"PK")
+        outdirs.append(str(outdir))
+        return 0, ""
+
+    monkeypatch.setattr(converter, "_run_soffice", soffice_writing_output)
+    converter._doc_to_docx_via_libreoffice(src, work_dir=work_dir)
+
+    monkeypatch.setattr(converter, "_run_soffice", soffice_writing_nothing)
+    with pytest.raises(RuntimeError, match="did not produce"):
+        converter._doc_to_docx_via_libreoffice(src, work_dir=work_dir)
+
+    assert outdirs[0] != outdirs[1]
+
+
+def test_run_soffice_stop_event_kills_running_process() -> None:
+    stop_event = threading.Event()
+    threading.Timer(0.2, stop_event.set).start()
+
+    start = time.monotonic()
+    with pytest.raises(ConversionCancelled):
+        _run_soffice([sys.executable, "-c", "import time; time.sleep(30)"], stop_event=stop_event)
+
+    assert time.monotonic() - start < 10
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            # Zombies are dead but may not be reaped yet in a container.
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_listener_close_kills_processes_started_by_soffice(tmp_path: Path) -> None:
+    # Stands in for the soffice wrapper, which starts soffice.bin and waits.
+    pid_file = tmp_path / "child.pid"
+    script = tmp_path / "soffice"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import subprocess, sys, time\n"
+        "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+        f"open({str(pid_file)!r}, 'w').write(str(child.pid))\n"
+        "time.sleep(30)\n"
+    )
+    script.chmod(0o755)
+
+    listener = _LibreOfficeListener(str(script))
+    listener.start()
+    deadline = time.monotonic() + 10
+    while not pid_file.exists() or not pid_file.read_text():
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+    child_pid = int(pid_file.read_text())
+
+    listener.close()
+
+    deadline = time.monotonic() + 5
+    while _process_alive(child_pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _process_alive(child_pid)
+    assert not listener.profile_dir.exists()
+
+
+@pytest.mark.skipif(os.name != "posix", reason="uses process groups")
+def test_kill_process_group_does_not_wait_on_pipes_held_by_escaped_child(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(converter, "_KILL_TIMEOUT", 0.5)
+    # Ignores SIGTERM and leaves behind a child outside its process group
+    # that keeps the output pipe open.
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import signal, subprocess, sys, time\n"
+            "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+            "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'],"
+            " start_new_session=True)\n"
+            "print(child.pid, flush=True)\n"
+            "time.sleep(30)\n",
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+        start_new_session=True,
+    )
+    child_pid = int(proc.stdout.readline())
+    try:
+        start = time.monotonic()
+        converter._kill_process_group(proc)
+        assert time.monotonic() - start < 5
+        assert proc.returncode is not None
+    finally:
+        os.kill(child_pid, signal.SIGKILL)
+        proc.stdout.close()
+
+
+class _FakeSoffice:
+    """Stands in for a soffice process; returncode None means still running."""
+
+    def __init__(self, cmd: list[str], **kwargs: object) -> None:
+        self.cmd = cmd
+        self.returncode: int | None = None
+
+    def poll(self) -> int | None:
+        return self.returncode
+
+
+@pytest.fixture
+def fake_soffice(monkeypatch: pytest.MonkeyPatch) -> dict[str, list]:
+    """Stub out soffice processes and listener sockets for SofficePool tests."""
+    # exit_code: what soffice exits with right after starting, if anything.
+    state: dict[str, list] = {"procs": [], "killed": [], "exit_code": [None]}
+
+    def popen(cmd: list[str], **kwargs: object) -> _FakeSoffice:
+        proc = _FakeSoffice(cmd, **kwargs)
+        proc.returncode = state["exit_code"][0]
+        state["procs"].append(proc)
+        return proc
+
+    def create_connection(address: tuple[str, int], timeout: float) -> object:
+        return type("Conn", (), {"close": lambda self: None})()
+
+    def kill(proc: _FakeSoffice) -> None:
+        state["killed"].append(proc)
+        proc.returncode = -15
+
+    monkeypatch.setattr(converter.subprocess, "Popen", popen)
+    monkeypatch.setattr(converter.socket, "create_connection", create_connection)
+    monkeypatch.setattr(converter, "_kill_process_group", kill)
+    return state
+
+
+def test_soffice_pool_starts_and_closes_listeners(fake_soffice: dict[str, list]) -> None:
+    pool = SofficePool("soffice", size=2)
+    pool.start()
+
+    procs = fake_soffice["procs"]
+    assert len(procs) == 2
+    assert all(proc.cmd[0] == "soffice" for proc in procs)
+    assert all(any(arg.startswith("--accept=socket") for arg in proc.cmd) for proc in procs)
+    assert len({proc.cmd[1] for proc in procs}) == 2  # one profile each
+
+    pool.close()
+
+    assert fake_soffice["killed"] == procs
+    assert not any(path.exists() for path in pool.profile_dirs)
+
+
+def test_listeners_are_never_given_the_same_port(
+    fake_soffice: dict[str, list], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # The OS hands out the same free port twice in a row.
+    ports = iter([40001, 40001, 40002])
+
+    class ProbeSocket:
+        def __enter__(self) -> "ProbeSocket":
+            return self
+
+        def __exit__(self, *exc: object) -> None:
+            pass
+
+        def bind(self, address: tuple[str, int]) -> None:
+            self.port = next(ports)
+
+        def getsockname(self) -> tuple[str, int]:
+            return "127.0.0.1", self.port
+
+    monkeypatch.setattr(converter.socket, "socket", ProbeSocket)
+
+    with SofficePool("soffice", size=2):
+        accepts = [proc.cmd[-1] for proc in fake_soffice["procs"]]
+
+    assert accepts == [
+        "--accept=socket,host=127.0.0.1,port=40001;urp;",
+        "--accept=socket,host=127.0.0.1,port=40002;urp;",
+    ]
+    assert not converter._listener_ports
+
+
+def test_soffice_pool_start_fails_when_listener_never_comes_up(
+    fake_soffice: dict[str, list],
+) -> None:
+    fake_soffice["exit_code"][0] = 1
+    pool = SofficePool("soffice", size=1)
+    try:
+        with pytest.raises(RuntimeError, match="LibreOffice"):
+            pool.start()
+        # Started again, each time on a new port, before giving up.
+        ports = [proc.cmd[-1] for proc in fake_soffice["procs"]]
+        assert len(ports) == converter._LISTENER_START_ATTEMPTS
+        assert len(set(ports)) == len(ports)
+    finally:
+        pool.close()
+    assert not converter._listener_ports
+
+
+def test_convert_folder_fails_only_doc_files_when_pool_cannot_start(
+    tmp_path: Path,
+    fake_soffice: dict[str, list],
+    soffice_on_path: None,
+    fake_convert: dict[str, list],
+) -> None:
+    (tmp_path / "a.docx").write_bytes(b"PK\x03\x04")
+    (tmp_path / "b.doc").write_bytes(b"x")
+    fake_soffice["exit_code"][0] = 1
+
+    pool = SofficePool("soffice", size=1)
+    try:
+        report = convert_folder(
+            input_dir=tmp_path, output_dir=tmp_path / "out", include_doc=True, soffice_pool=pool
+        )
+    finally:
+        pool.close()
+
+    assert (report.converted, report.failed) == (1, 1)
+    assert report.failures[0].startswith(f"{tmp_path / 'b.doc'}: LibreOffice")
+
+
+def test_soffice_pool_lease_restarts_exited_listener(fake_soffice: dict[str, list]) -> None:
+    with SofficePool("soffice", size=1) as pool:
+        first = fake_soffice["procs"][0]
+        first.returncode = 1  # soffice crashed between conversions
+
+        with pool.lease() as profile_dir:
+            assert profile_dir == pool.profile_dirs[0]
+
+        assert len(fake_soffice["procs"]) == 2
+        assert fake_soffice["procs"][1].returncode is None
+
+
+def test_soffice_pool_does_not_restart_listeners_once_closed(
+    fake_soffice: dict[str, list],
+) -> None:
+    pool = SofficePool("soffice", size=1)
+    pool.start()
+    pool.close()
+
+    with pytest.raises(ConversionCancelled):
+        with pool.lease():
+            pass
+    with pytest.raises(ConversionCancelled):
+        pool.start()
+    with pytest.raises(ConversionCancelled):
+        pool.listeners[0].start()
+    assert len(fake_soffice["procs"]) == 1
+
+
+def test_soffice_pool_closed_while_starting_leaves_no_listener_running(
+    fake_soffice: dict[str, list], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pool = SofficePool("soffice", size=2)
+
+    def close_then_refuse(address: tuple[str, int], timeout: float) -> object:
+        # The GUI window closes while the listeners are still coming up.
+        pool.close()
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(converter.socket, "create_connection", close_then_refuse)
+
+    with pytest.raises(ConversionCancelled):
+        pool.start()
+
+    procs = fake_soffice["procs"]
+    assert len(procs) == 2
+    assert all(proc.returncode is not None for proc in procs)
+
+
+def test_soffice_pool_restarts_listener_after_timed_out_conversion(
+    tmp_path: Path, fake_soffice: dict[str, list], hanging_soffice: list[float | None]
+) -> None:
+    (tmp_path / "hung.doc").write_bytes(b"x")
+
+    with SofficePool("soffice", size=1) as pool:
+        report = convert_folder(
+            input_dir=tmp_path, output_dir=tmp_path / "out", include_doc=True, soffice_pool=pool
+        )
+        procs = list(fake_soffice["procs"])
+
+    assert report.failed == 1
+    # The listener still busy with the timed-out batch is replaced before the
+    # retry, and again after the retry times out.
+    assert len(procs) == 2
+    assert fake_soffice["killed"] == procs
+
+
+def test_cancel_during_doc_batch_does_not_restart_listeners(
+    tmp_path: Path,
+    fake_soffice: dict[str, list],
+    soffice_on_path: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    for i in range(40):
+        (tmp_path / f"file{i:02}.doc").write_bytes(b"x")
+    stop_event = threading.Event()
+    started_at_cancel: list[int] = []
+
+    def cancelled_soffice(cmd: list[str], **kwargs: object) -> tuple[int, str]:
+        # Cancel arrives while the batch runs, as from the GUI's Cancel button.
+        if not stop_event.is_set():
+            started_at_cancel.append(len(fake_soffice["procs"]))
+            stop_event.set()
+        raise ConversionCancelled
+
+    monkeypatch.setattr(converter, "_run_soffice", cancelled_soffice)
+
+    with SofficePool("soffice", size=2) as pool:
+        report = convert_folder(
+            input_dir=tmp_path,
+            output_dir=tmp_path / "out",
+            include_doc=True,
+            stop_event=stop_event,
+            soffice_pool=pool,
+        )
+        procs = list(fake_soffice["procs"])
+
+    assert (report.converted, report.failed) == (0, 0)
+    # No listener is started again to retry files after the cancel.
+    assert started_at_cancel == [2]
+    assert len(procs) == 2
@@ -41,3 +41,12 @@ def test_assets_dir_for_md_is_sibling(tmp_path: Path) -> None:
     md_path = tmp_path / "out" / "My Doc.md"
     assets = _assets_dir_for_md(md_path)
     assert assets == tmp_path / "out" / "My Doc_files"
+
+
+def test_iter_input_files_matches_suffix_like_pathlib(tmp_path: Path) -> None:
+    (tmp_path / "UPPER.DOCX").write_text("x")
+    (tmp_path / ".docx").write_text("x")
+    (tmp_path / "folder.docx").mkdir()
+
+    files = _iter_input_files(tmp_path, recursive=True, include_doc=False)
+    assert [p.name for p in files] == ["UPPER.DOCX"]
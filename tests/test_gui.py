@@ -1,8 +1,106 @@
 """Unit tests for GUI components."""
 
+import os
 from pathlib import Path
 
-from docs_to_markdown.gui import convert_folder_with_progress, DocsToMarkdownGUI
+import pytest
+
+from docs_to_markdown import converter
+from docs_to_markdown.gui import (
+    _format_markdown,
+    _scan_for_word_docs,
+    convert_folder_with_progress,
+    DocsToMarkdownGUI,
+)
+
+
+class FakeRoot:
+    """Records after() callbacks instead of running a Tk event loop."""
+
+    def __init__(self) -> None:
+        self.pending: dict[str, tuple[object, tuple[object, ...]]] = {}
+        self._next_id = 0
+
+    def after(self, ms: int, func: object, *args: object) -> str:
+        self._next_id += 1
+        after_id = f"after#{self._next_id}"
+        self.pending[after_id] = (func, args)
+        return after_id
+
+    def after_cancel(self, after_id: str) -> None:
+        del self.pending[after_id]
+
+    def run_pending(self) -> None:
+        pending, self.pending = self.pending, {}
+        for func, args in pending.values():
+            func(*args)
+
+
+class FakeTree:
+    """Stands in for the output files Treeview."""
+
+    def __init__(self) -> None:
+        self.rows: list[str] = []
+        self.inserted: list[str] = []
+        self.selected = ""
+
+    def get_children(self) -> tuple[str, ...]:
+        return tuple(self.rows)
+
+    def delete(self, *iids: str) -> None:
+        self.rows = [row for row in self.rows if row not in iids]
+
+    def insert(self, parent: str, index: int, iid: str, text: str) -> None:
+        self.rows.insert(index, iid)
+        self.inserted.append(text)
+
+    def selection(self) -> tuple[str, ...]:
+        return (self.selected,)
+
+
+class FakeWidget:
+    """Stands in for labels, progress bars and textboxes."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.value: object = None
+        self.text = ""
+
+    def set(self, value: float) -> None:
+        self.calls += 1
+        self.value = value
+
+    def configure(self, **kwargs: object) -> None:
+        if "text" in kwargs:
+            self.calls += 1
+            self.value = kwargs["text"]
+
+    def delete(self, start: str, end: str) -> None:
+        self.text = ""
+
+    def insert(self, index: str, text: str) -> None:
+        self.text = text
+
+
+@pytest.fixture
+def headless_gui() -> DocsToMarkdownGUI:
+    """A DocsToMarkdownGUI with fake widgets in place of a Tk window."""
+    gui = DocsToMarkdownGUI.__new__(DocsToMarkdownGUI)
+    gui._root = FakeRoot()
+    gui._files_tree = FakeTree()
+    gui._preview_text = FakeWidget()
+    gui._progress_bar = FakeWidget()
+    gui._status_label = FakeWidget()
+    gui._current_markdown_text = ""
+    gui._preview_seq = 0
+    gui._preview_after_id = None
+    gui._listed_output_path = None
+    gui._listed_keys = []
+    gui._conversion_thread = None
+    gui._pending_progress = None
+    gui._shown_progress = None
+    gui._soffice_cache = None
+    return gui
 
 
 def test_convert_folder_with_progress_basic(tmp_path: Path) -> None:
@@ -192,6 +290,23 @@ def test_convert_folder_with_progress_stop_event(tmp_path: Path) -> None:
     assert progress_count[0] >= 1
 
 
+def test_scan_for_word_docs(tmp_path: Path) -> None:
+    """Test the single-pass folder check for Word documents."""
+    assert _scan_for_word_docs(tmp_path) == (False, False)
+
+    (tmp_path / "notes.txt").write_text("x")
+    (tmp_path / "folder.docx").mkdir()
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "nested.doc").write_text("x")
+    assert _scan_for_word_docs(tmp_path) == (False, False)
+
+    (tmp_path / "REPORT.DOCX").write_text("x")
+    assert _scan_for_word_docs(tmp_path) == (True, False)
+
+    (tmp_path / "old.Doc").write_text("x")
+    assert _scan_for_word_docs(tmp_path) == (True, True)
+
+
 def test_render_markdown_simple_text() -> None:
     """Test rendering simple markdown text."""
     gui = DocsToMarkdownGUI()
@@ -202,6 +317,21 @@ def test_render_markdown_simple_text() -> None:
     assert "Hello, world!" in rendered
 
 
+def test_render_markdown_plain_line_matches_full_render() -> None:
+    """Test that the plain-text fast path renders like the full parser."""
+    gui = DocsToMarkdownGUI.__new__(DocsToMarkdownGUI)
+
+    for md_text in [
+        "Hello, world!  \n",
+        "Version 2.0 is out",
+        "1986. A good year",
+        "    indented code",
+        "a line\nand another",
+        "Use *this* one",
+    ]:
+        assert gui._render_markdown(md_text) == _format_markdown(md_text)
+
+
 def test_render_markdown_headers() -> None:
     """Test rendering markdown headers."""
     gui = DocsToMarkdownGUI()
@@ -329,6 +459,136 @@ code block
     assert "```" in rendered
 
 
+def test_format_markdown_keeps_inline_markup_and_nesting() -> None:
+    """Test the preview formatter without a window."""
+    md_text = (
+        "Intro with **bold**, `code` and [a link](https://example.com).\n\n"
+        "- Outer\n  - Inner\n\n"
+        "| A | B |\n|---|---|\n| 1 | 2 |\n"
+    )
+    rendered = _format_markdown(md_text)
+
+    assert "Intro with **bold**, `code` and [a link](https://example.com)." in rendered
+    assert "- Outer Inner" in rendered
+    assert "| A | B |\n| 1 | 2 |" in rendered
+
+
+def test_apply_preview_ignores_stale_results(headless_gui: DocsToMarkdownGUI) -> None:
+    """Test that a slow preview cannot overwrite a newer one."""
+    gui = headless_gui
+    gui._preview_seq = 2
+
+    gui._apply_preview(1, "# Old", "# Old")
+    assert gui._preview_text.text == ""
+
+    gui._apply_preview(2, "# New", "# New")
+    assert gui._preview_text.text == "# New"
+    assert gui._current_markdown_text == "# New"
+
+
+def test_update_files_list_only_touches_changed_rows(
+    headless_gui: DocsToMarkdownGUI, tmp_path: Path
+) -> None:
+    """Test that refreshing the files list keeps rows and sorted order."""
+    gui = headless_gui
+
+    (tmp_path / "b.md").write_text("b")
+    (tmp_path / "d.md").write_text("d")
+    gui._update_files_list(tmp_path)
+
+    (tmp_path / "d.md").unlink()
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "c.md").write_text("c")
+    (tmp_path / "A.md").write_text("a")
+    gui._update_files_list(tmp_path)
+
+    assert gui._files_tree.rows == [
+        str(tmp_path / "A.md"),
+        str(tmp_path / "b.md"),
+        str(tmp_path / "sub" / "c.md"),
+    ]
+    assert gui._files_tree.inserted == ["b.md", "d.md", "A.md", str(Path("sub/c.md"))]
+
+
+def test_file_selection_preview_is_debounced(headless_gui: DocsToMarkdownGUI) -> None:
+    """Test that rapid selection changes preview only the final row."""
+    gui = headless_gui
+    previewed: list[Path] = []
+    gui._show_preview = previewed.append
+
+    for name in ["a.md", "b.md", "c.md"]:
+        gui._files_tree.selected = name
+        gui._on_file_selected(None)
+
+    assert len(gui._root.pending) == 1
+    gui._root.run_pending()
+    assert previewed == [Path("c.md")]
+    assert gui._preview_after_id is None
+
+
+def test_update_progress_is_polled_from_main_thread(headless_gui: DocsToMarkdownGUI) -> None:
+    """Test that progress updates are only published and shown by the poll."""
+
+    class FakeThread:
+        alive = True
+
+        def is_alive(self) -> bool:
+            return self.alive
+
+    gui = headless_gui
+    gui._conversion_thread = FakeThread()
+
+    gui._update_progress(0, 4, Path("a.docx"))
+    gui._update_progress(1, 4, Path("b.docx"))
+    assert gui._root.pending == {}
+
+    gui._drain_progress()
+    assert gui._progress_bar.value == 0.25
+    assert gui._status_label.value == "Converting: b.docx (2/4)"
+    assert len(gui._root.pending) == 1
+
+    # Nothing new since the last poll: the widgets are left alone.
+    gui._root.run_pending()
+    assert gui._progress_bar.calls == 1
+    assert len(gui._root.pending) == 1
+
+    # Polling stops once the conversion thread is done.
+    gui._conversion_thread.alive = False
+    gui._root.run_pending()
+    assert gui._root.pending == {}
+
+
+def test_find_soffice_caches_lookup(
+    headless_gui: DocsToMarkdownGUI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that soffice is found once and a failed lookup is retried."""
+    calls: list[str] = []
+
+    def fake_which(name: str) -> str | None:
+        calls.append(name)
+        return "/usr/bin/soffice"
+
+    monkeypatch.setattr(converter.shutil, "which", fake_which)
+    gui = headless_gui
+    try:
+        assert gui._find_soffice() == "/usr/bin/soffice"
+        assert gui._find_soffice() == "/usr/bin/soffice"
+        assert calls == ["soffice"]
+
+        gui._soffice_cache = (gui._soffice_cache[0] - 60, "/usr/bin/soffice")
+        assert gui._find_soffice() == "/usr/bin/soffice"
+        assert calls == ["soffice"]
+
+        gui._soffice_cache = (gui._soffice_cache[0] - 60, None)
+        assert gui._find_soffice() == "/usr/bin/soffice"
+        assert calls == ["soffice", "soffice"]
+
+        assert gui._find_soffice(rescan=True) == "/usr/bin/soffice"
+        assert calls == ["soffice", "soffice", "soffice"]
+    finally:
+        converter._find_soffice.cache_clear()
+
+
 def test_copy_preview_has_method() -> None:
     """Test that _copy_preview method exists."""
     gui = DocsToMarkdownGUI()
@@ -348,3 +608,72 @@ def test_copy_button_exists() -> None:
     gui = DocsToMarkdownGUI()
     assert hasattr(gui, "_copy_btn")
     assert gui._copy_btn is not None
+
+
+class FakeVar:
+    """Stands in for entries and checkbox variables."""
+
+    def __init__(self, value: object) -> None:
+        self.value = value
+
+    def get(self) -> object:
+        return self.value
+
+
+def test_start_conversion_hands_soffice_pool_to_worker(
+    headless_gui: DocsToMarkdownGUI, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the LibreOffice pool is created on the UI thread, not the worker."""
+    from docs_to_markdown import gui as gui_module
+
+    src = tmp_path / "a.doc"
+    src.write_bytes(b"x")
+    pool = object()
+    threads: list[dict[str, object]] = []
+
+    class RecordingThread:
+        def __init__(self, **kwargs: object) -> None:
+            threads.append(kwargs)
+
+        def start(self) -> None:
+            pass
+
+    monkeypatch.setattr(gui_module.threading, "Thread", RecordingThread)
+    gui = headless_gui
+    gui._input_entry = FakeVar(str(src))
+    gui._output_entry = FakeVar(str(tmp_path / "out"))
+    gui._recursive_var = FakeVar(False)
+    gui._include_doc_var = FakeVar(False)
+    gui._overwrite_var = FakeVar(False)
+    gui._convert_btn = FakeWidget()
+    gui._cancel_btn = FakeWidget()
+    gui._results_text = FakeWidget()
+    gui._stop_conversion = gui_module.threading.Event()
+    monkeypatch.setattr(gui, "_validate_inputs", lambda *args: (True, ""), raising=False)
+    monkeypatch.setattr(gui, "_get_soffice_pool", lambda: pool, raising=False)
+
+    gui._start_conversion()
+
+    assert len(threads) == 1
+    assert threads[0]["args"][-1] is pool
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink") or os.name != "posix", reason="needs symlinks")
+def test_run_conversion_rejects_output_symlinked_into_input(
+    headless_gui: DocsToMarkdownGUI, tmp_path: Path
+) -> None:
+    """Test that an output folder inside the input is caught once symlinks resolve."""
+    input_dir = tmp_path / "in"
+    (input_dir / "md").mkdir(parents=True)
+    (input_dir / "a.docx").write_bytes(b"PK\x03\x04")
+    link = tmp_path / "out"
+    link.symlink_to(input_dir / "md")
+    gui = headless_gui
+
+    gui._run_conversion(input_dir, link, False, False, False, None)
+
+    [(func, (report, error))] = gui._root.pending.values()
+    assert func == gui._on_conversion_complete
+    assert report is None
+    assert "cannot be inside the input folder" in str(error)
+    assert list((input_dir / "md").iterdir()) == []